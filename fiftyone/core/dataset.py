@@ -1633,7 +1633,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             add_info=add_info,
         )
 
-    def add_images(self, samples, sample_parser=None, tags=None):
+    def add_images(
+        self, samples, sample_parser=None, tags=None, num_workers=None
+    ):
         """Adds the given images to the dataset.
 
         This operation does not read the images.
@@ -1651,6 +1653,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 :class:`fiftyone.utils.data.parsers.UnlabeledImageSampleParser`
                 instance to use to parse the samples
             tags (None): an optional list of tags to attach to each sample
+            num_workers (None): an optional number of background threads to
+                use to parse the samples. See
+                :func:`fiftyone.utils.data.parsers.add_images` for details
 
         Returns:
             a list of IDs of the samples that were added to the dataset
@@ -1658,7 +1663,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         if sample_parser is None:
             sample_parser = foud.ImageSampleParser()
 
-        return foud.add_images(self, samples, sample_parser, tags=tags)
+        return foud.add_images(
+            self, samples, sample_parser, tags=tags, num_workers=num_workers
+        )
 
     def add_labeled_images(
         self,
@@ -1667,6 +1674,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         label_field="ground_truth",
         tags=None,
         expand_schema=True,
+        num_workers=None,
     ):
         """Adds the given labeled images to the dataset.
 
@@ -1689,6 +1697,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             expand_schema (True): whether to dynamically add new sample fields
                 encountered to the dataset schema. If False, an error is raised
                 if a sample's schema is not a subset of the dataset schema
+            num_workers (None): an optional number of background threads to
+                use to parse the samples. See
+                :func:`fiftyone.utils.data.parsers.add_images` for details
 
         Returns:
             a list of IDs of the samples that were added to the dataset
@@ -1700,6 +1711,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             label_field=label_field,
             tags=tags,
             expand_schema=expand_schema,
+            num_workers=num_workers,
         )
 
     def add_images_dir(self, images_dir, tags=None, recursive=True):
@@ -1844,7 +1856,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             expand_schema=expand_schema,
         )
 
-    def add_videos(self, samples, sample_parser=None, tags=None):
+    def add_videos(
+        self, samples, sample_parser=None, tags=None, num_workers=None
+    ):
         """Adds the given videos to the dataset.
 
         This operation does not read the videos.
@@ -1862,6 +1876,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 :class:`fiftyone.utils.data.parsers.UnlabeledImageSampleParser`
                 instance to use to parse the samples
             tags (None): an optional list of tags to attach to each sample
+            num_workers (None): an optional number of background threads to
+                use to parse the samples. See
+                :func:`fiftyone.utils.data.parsers.add_images` for details
 
         Returns:
             a list of IDs of the samples that were added to the dataset
@@ -1869,7 +1886,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         if sample_parser is None:
             sample_parser = foud.VideoSampleParser()
 
-        return foud.add_videos(self, samples, sample_parser, tags=tags)
+        return foud.add_videos(
+            self, samples, sample_parser, tags=tags, num_workers=num_workers
+        )
 
     def add_labeled_videos(
         self,
@@ -1878,6 +1897,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         label_field="ground_truth",
         tags=None,
         expand_schema=True,
+        num_workers=None,
     ):
         """Adds the given labeled videos to the dataset.
 
@@ -1899,6 +1919,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             expand_schema (True): whether to dynamically add new sample fields
                 encountered to the dataset schema. If False, an error is raised
                 if a sample's schema is not a subset of the dataset schema
+            num_workers (None): an optional number of background threads to
+                use to parse the samples. See
+                :func:`fiftyone.utils.data.parsers.add_images` for details
 
         Returns:
             a list of IDs of the samples that were added to the dataset
@@ -1910,6 +1933,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             label_field=label_field,
             tags=tags,
             expand_schema=expand_schema,
+            num_workers=num_workers,
         )
 
     def add_videos_dir(self, videos_dir, tags=None, recursive=True):
@@ -2660,6 +2684,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         )
 
     def _validate_sample(self, sample):
+        self._validate_media_type(sample)
+
         fields = self.get_field_schema(include_private=True)
 
         non_existent_fields = {
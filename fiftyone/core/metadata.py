@@ -9,7 +9,8 @@ import logging
 import multiprocessing
 import os
 
-import eta.core.image as etai
+import PIL.Image
+
 import eta.core.utils as etau
 import eta.core.video as etav
 
@@ -77,14 +78,18 @@ class ImageMetadata(Metadata):
             an :class:`ImageMetadata`
         """
         if etau.is_str(image_or_path):
-            # From image on disk
-            m = etai.ImageMetadata.build_for(image_or_path)
+            # From image on disk. The file is opened once and its size is read
+            # from the open descriptor, so the path is only resolved once
+            with open(image_or_path, "rb") as f:
+                size_bytes = os.fstat(f.fileno()).st_size
+                width, height, num_channels = _get_image_info(f)
+
             return cls(
-                size_bytes=m.size_bytes,
-                mime_type=m.mime_type,
-                width=m.frame_size[0],
-                height=m.frame_size[1],
-                num_channels=m.num_channels,
+                size_bytes=size_bytes,
+                mime_type=etau.guess_mime_type(image_or_path),
+                width=width,
+                height=height,
+                num_channels=num_channels,
             )
 
         # From in-memory image
@@ -141,6 +146,28 @@ class VideoMetadata(Metadata):
         )
 
 
+def _get_image_info(f):
+    # Opening an image only reads its header; the pixels are never decoded
+    with PIL.Image.open(f) as img:
+        width, height = img.size
+        mode = img.mode
+        if mode == "P":
+            # Palette images are expanded to RGB(A) when decoded
+            num_channels = 4 if "transparency" in img.info else 3
+        elif mode in _DECODED_NUM_CHANNELS:
+            num_channels = _DECODED_NUM_CHANNELS[mode]
+        else:
+            num_channels = len(img.getbands())
+
+    return width, height, num_channels
+
+
+# Images are decoded via OpenCV, which expands grayscale images with alpha to
+# BGRA and converts CMYK images to BGR, so the number of channels of these
+# modes differs from their number of bands
+_DECODED_NUM_CHANNELS = {"LA": 4, "La": 4, "PA": 4, "CMYK": 3}
+
+
 def compute_sample_metadata(sample, skip_failures=False):
     """Populates the ``metadata`` field of the sample.
 
@@ -6,13 +6,15 @@ View stages.
 |
 """
 from collections import defaultdict
-import random
+import hashlib
+import numbers
 import reprlib
 import uuid
 import warnings
 
 from bson import ObjectId
 from deprecated import deprecated
+import numpy as np
 from pymongo import ASCENDING, DESCENDING
 
 import eta.core.utils as etau
@@ -2642,7 +2644,7 @@ class Shuffle(ViewStage):
 
     def __init__(self, seed=None, _randint=None):
         self._seed = seed
-        self._randint = _randint or _get_rng(seed).randint(1e7, 1e10)
+        self._randint = _randint or int(_get_rng(seed).integers(1e7, 1e10))
 
     @property
     def seed(self):
@@ -2897,7 +2899,7 @@ class Take(ViewStage):
     def __init__(self, size, seed=None, _randint=None):
         self._seed = seed
         self._size = size
-        self._randint = _randint or _get_rng(seed).randint(1e7, 1e10)
+        self._randint = _randint or int(_get_rng(seed).integers(1e7, 1e10))
 
     @property
     def size(self):
@@ -2961,13 +2963,21 @@ def _get_sample_ids(samples_or_ids):
     return list(samples_or_ids)
 
 
+# Shared generator for unseeded stages, so that they need not each seed one
+_RNG = np.random.default_rng()
+
+
 def _get_rng(seed):
     if seed is None:
-        return random
+        return _RNG
+
+    # Generators only accept non-negative integer seeds, so any other seed is
+    # deterministically hashed to one
+    if not isinstance(seed, numbers.Integral) or seed < 0:
+        digest = hashlib.sha256(str(seed).encode()).digest()
+        seed = np.random.SeedSequence(int.from_bytes(digest, "little"))
 
-    _random = random.Random()
-    _random.seed(seed)
-    return _random
+    return np.random.default_rng(seed)
 
 
 def _get_labels_field(sample_collection, field_path):
@@ -325,7 +325,7 @@ def load_xml_as_json_dict(xml_path):
         a JSON dict
     """
     with open(xml_path, "rb") as f:
-        return xmltodict.parse(f.read())
+        return xmltodict.parse(f)
 
 
 def parse_serializable(obj, cls):
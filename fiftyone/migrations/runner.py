@@ -246,7 +246,7 @@ class MigrationRunner(object):
         Args:
             verbose (False): whether to log incremental migrations that are run
         """
-        client = foo.get_db_client()
+        client = foo.get_db_conn().client
         for rev, module in self._admin_revisions:
             if verbose:
                 logger.info(
@@ -274,7 +274,7 @@ class DatabaseConfig(etas.Serializable):
 
 
 def _database_exists():
-    client = foo.get_db_client()
+    client = foo.get_db_conn().client
     return foc.DEFAULT_DATABASE in client.list_database_names()
 
 
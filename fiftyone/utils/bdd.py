@@ -6,9 +6,12 @@ Utilities for working with datasets in
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 import logging
+import multiprocessing
 import os
+import shutil
 import warnings
 
 import eta.core.image as etai
@@ -379,7 +382,7 @@ def parse_bdd100k_dataset(
     Raises:
         OSError: if any required source files are not present
     """
-    put_dir = etau.copy_dir if copy_files else etau.move_dir
+    put_dir = _copy_dir if copy_files else etau.move_dir
     put_file = etau.copy_file if copy_files else etau.move_file
 
     _ensure_bdd100k_dir(source_dir)
@@ -471,6 +474,43 @@ def _raise_bdd100k_error(msg):
     )
 
 
+def _copy_dir(indir, outdir, num_workers=None):
+    # Same semantics as `etau.copy_dir()`, but the files are copied in
+    # parallel, since the image directories contain ~100K files each
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    if os.path.isdir(outdir):
+        shutil.rmtree(outdir, ignore_errors=True)
+
+    inpaths = []
+    outpaths = []
+    _list_files_to_copy(indir, outdir, inpaths, outpaths)
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        # Consume the results so that any errors are raised
+        for _ in executor.map(shutil.copy, inpaths, outpaths):
+            pass
+
+
+def _list_files_to_copy(indir, outdir, inpaths, outpaths):
+    # Like `etau.copy_dir()`, includes hidden files, skips hidden directories,
+    # and follows symlinks to files and directories
+    etau.ensure_dir(outdir)
+    with os.scandir(indir) as entries:
+        for entry in entries:
+            if entry.is_file():
+                inpaths.append(entry.path)
+                outpaths.append(os.path.join(outdir, entry.name))
+            elif entry.is_dir() and not entry.name.startswith("."):
+                _list_files_to_copy(
+                    entry.path,
+                    os.path.join(outdir, entry.name),
+                    inpaths,
+                    outpaths,
+                )
+
+
 def _parse_bdd_annotation(d, frame_size):
     labels = {}
 
@@ -8,6 +8,7 @@ Utilities for working with the
 """
 import logging
 import os
+import zipfile
 
 import eta.core.serial as etas
 import eta.core.utils as etau
@@ -80,23 +81,25 @@ def parse_cityscapes_dataset(
 
     _splits = [_parse_split(s) for s in splits]
 
-    images_dir = _extract_images(images_zip_path, scratch_dir)
+    images_dir = _extract_images(images_zip_path, scratch_dir, _splits)
 
     if fine_annos_zip_path:
-        fine_annos_dir = _extract_fine_annos(fine_annos_zip_path, scratch_dir)
+        fine_annos_dir = _extract_fine_annos(
+            fine_annos_zip_path, scratch_dir, _splits
+        )
     else:
         fine_annos_dir = None
 
     if coarse_annos_zip_path:
         coarse_annos_dir = _extract_coarse_annos(
-            coarse_annos_zip_path, scratch_dir
+            coarse_annos_zip_path, scratch_dir, _splits
         )
     else:
         coarse_annos_dir = None
 
     if person_annos_zip_path:
         person_annos_dir = _extract_person_annos(
-            person_annos_zip_path, scratch_dir
+            person_annos_zip_path, scratch_dir, _splits
         )
     else:
         person_annos_dir = None
@@ -287,52 +290,64 @@ def _export_split(
     dataset.delete()
 
 
-def _extract_images(images_zip_path, scratch_dir):
+def _extract_images(images_zip_path, scratch_dir, splits):
     tmp_dir = os.path.join(scratch_dir, "images")
     images_dir = os.path.join(tmp_dir, "leftImg8bit")
-
-    if not os.path.isdir(images_dir):
-        logger.info("Extracting images...")
-        etau.extract_zip(images_zip_path, outdir=tmp_dir, delete_zip=False)
-
+    _extract_splits(images_zip_path, tmp_dir, "leftImg8bit", splits, "images")
     return images_dir
 
 
-def _extract_fine_annos(fine_annos_zip_path, scratch_dir):
+def _extract_fine_annos(fine_annos_zip_path, scratch_dir, splits):
     tmp_dir = os.path.join(scratch_dir, "fine-annos")
     fine_annos_dir = os.path.join(tmp_dir, "gtFine")
-
-    if not os.path.isdir(fine_annos_dir):
-        logger.info("Extracting fine annotations...")
-        etau.extract_zip(fine_annos_zip_path, outdir=tmp_dir, delete_zip=False)
-
+    _extract_splits(
+        fine_annos_zip_path, tmp_dir, "gtFine", splits, "fine annotations"
+    )
     return fine_annos_dir
 
 
-def _extract_coarse_annos(coarse_annos_zip_path, scratch_dir):
+def _extract_coarse_annos(coarse_annos_zip_path, scratch_dir, splits):
     tmp_dir = os.path.join(scratch_dir, "coarse-annos")
     coarse_annos_dir = os.path.join(tmp_dir, "gtCoarse")
-
-    if not os.path.isdir(coarse_annos_dir):
-        logger.info("Extracting coarse annotations...")
-        etau.extract_zip(
-            coarse_annos_zip_path, outdir=tmp_dir, delete_zip=False
-        )
-
+    _extract_splits(
+        coarse_annos_zip_path,
+        tmp_dir,
+        "gtCoarse",
+        splits,
+        "coarse annotations",
+    )
     return coarse_annos_dir
 
 
-def _extract_person_annos(person_annos_zip_path, scratch_dir):
+def _extract_person_annos(person_annos_zip_path, scratch_dir, splits):
     tmp_dir = os.path.join(scratch_dir, "person-annos")
     person_annos_dir = os.path.join(tmp_dir, "gtBboxCityPersons")
+    _extract_splits(
+        person_annos_zip_path,
+        tmp_dir,
+        "gtBboxCityPersons",
+        splits,
+        "person annotations",
+    )
+    return person_annos_dir
 
-    if not os.path.isdir(person_annos_dir):
-        logger.info("Extracting person annotations...")
-        etau.extract_zip(
-            person_annos_zip_path, outdir=tmp_dir, delete_zip=False
-        )
 
-    return person_annos_dir
+def _extract_splits(zip_path, outdir, root, splits, desc):
+    # Only extracts the members of the requested splits that have not already
+    # been extracted, rather than the entire archive
+    splits = [
+        s for s in splits if not os.path.isdir(os.path.join(outdir, root, s))
+    ]
+    if not splits:
+        return
+
+    prefixes = tuple("%s/%s/" % (root, split) for split in splits)
+
+    with zipfile.ZipFile(zip_path, "r", allowZip64=True) as zf:
+        members = [m for m in zf.infolist() if m.filename.startswith(prefixes)]
+        if members:
+            logger.info("Extracting %s...", desc)
+            zf.extractall(path=outdir, members=members)
 
 
 def _parse_images(images_dir, split):
@@ -6,22 +6,27 @@ Utilities for working with datasets in
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-from collections import defaultdict
-from copy import copy
-from datetime import datetime
+from collections import defaultdict, deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
 import itertools
 import logging
+from operator import itemgetter
 import os
+import sys
+import tempfile
+import threading
 import warnings
+import xml.etree.ElementTree as ET
 
-import jinja2
+import numpy as np
 
 import eta.core.data as etad
 import eta.core.image as etai
 import eta.core.utils as etau
 
 import fiftyone as fo
-import fiftyone.constants as foc
 import fiftyone.core.labels as fol
 import fiftyone.core.metadata as fom
 import fiftyone.core.utils as fou
@@ -50,10 +55,6 @@ class CVATImageSampleParser(foud.LabeledImageTupleSampleParser):
     details.
     """
 
-    def __init__(self):
-        super().__init__()
-        self._cvat_image_cache = None
-
     @property
     def has_image_metadata(self):
         return True
@@ -67,11 +68,13 @@ class CVATImageSampleParser(foud.LabeledImageTupleSampleParser):
         }
 
     def get_image_metadata(self):
-        cvat_image = self._cvat_image
-        if cvat_image is None:
+        d = self.current_sample[1]
+        if d is None:
             return None
 
-        return cvat_image.get_image_metadata()
+        return fom.ImageMetadata(
+            width=int(d["@width"]), height=int(d["@height"])
+        )
 
     def get_label(self):
         """Returns the label for the current sample.
@@ -84,26 +87,11 @@ class CVATImageSampleParser(foud.LabeledImageTupleSampleParser):
             :class:`fiftyone.core.labels.ImageLabel` instances, or ``None`` if
             the sample is unlabeled
         """
-        cvat_image = self._cvat_image
-        if cvat_image is None:
+        d = self.current_sample[1]
+        if d is None:
             return None
 
-        return cvat_image.to_labels()
-
-    def clear_sample(self):
-        super().clear_sample()
-        self._cvat_image_cache = None
-
-    @property
-    def _cvat_image(self):
-        if self._cvat_image_cache is None:
-            self._cvat_image_cache = self._parse_cvat_image()
-
-        return self._cvat_image_cache
-
-    def _parse_cvat_image(self):
-        d = self.current_sample[1]
-        return CVATImage.from_image_dict(d) if d is not None else None
+        return CVATImage.from_image_dict(d).to_labels()
 
 
 class CVATVideoSampleParser(foud.LabeledVideoSampleParser):
@@ -122,6 +110,10 @@ class CVATVideoSampleParser(foud.LabeledVideoSampleParser):
     details.
     """
 
+    def __init__(self):
+        super().__init__()
+        self._annos_cache = _CVATVideoAnnotationsCache()
+
     @property
     def has_video_metadata(self):
         return False
@@ -150,9 +142,15 @@ class CVATVideoSampleParser(foud.LabeledVideoSampleParser):
         if not labels_path:
             return None
 
-        _, _, cvat_tracks = load_cvat_video_annotations(labels_path)
+        _, _, cvat_tracks = self._annos_cache.load(labels_path)
         return _cvat_tracks_to_frames_dict(cvat_tracks)
 
+    def clear_cache(self):
+        """Clears this parser's in-memory cache of recently parsed CVAT video
+        labels files.
+        """
+        self._annos_cache.clear()
+
 
 class CVATImageDatasetImporter(foud.LabeledImageDatasetImporter):
     """Importer for CVAT image datasets stored on disk.
@@ -190,32 +188,28 @@ class CVATImageDatasetImporter(foud.LabeledImageDatasetImporter):
         self._info = None
         self._images_map = None
         self._filenames = None
-        self._iter_filenames = None
+        self._next_idx = None
         self._num_samples = None
+        self._executor = None
+        self._next_future = None
 
     def __iter__(self):
-        self._iter_filenames = iter(self._filenames)
+        self._next_idx = 0
+        self._next_future = self._submit_next()
         return self
 
     def __len__(self):
         return self._num_samples
 
     def __next__(self):
-        filename = next(self._iter_filenames)
+        future = self._next_future
+        if future is None:
+            raise StopIteration
 
-        image_path = os.path.join(self._data_dir, filename)
+        # Start loading the next sample while this one is being consumed
+        self._next_future = self._submit_next()
 
-        cvat_image = self._images_map.get(filename, None)
-        if cvat_image is not None:
-            # Labeled image
-            image_metadata = cvat_image.get_image_metadata()
-            labels = cvat_image.to_labels()
-        else:
-            # Unlabeled image
-            image_metadata = fom.ImageMetadata.build_for(image_path)
-            labels = None
-
-        return image_path, image_metadata, labels
+        return future.result()
 
     @property
     def has_dataset_info(self):
@@ -238,7 +232,7 @@ class CVATImageDatasetImporter(foud.LabeledImageDatasetImporter):
         self._labels_path = os.path.join(self.dataset_dir, "labels.xml")
 
         if os.path.isfile(self._labels_path):
-            info, _, cvat_images = load_cvat_image_annotations(
+            info, _, cvat_images = _parse_cvat_image_annotations(
                 self._labels_path
             )
         else:
@@ -250,17 +244,49 @@ class CVATImageDatasetImporter(foud.LabeledImageDatasetImporter):
         # Index by filename
         self._images_map = {i.name: i for i in cvat_images}
 
-        filenames = etau.list_files(self._data_dir, abs_paths=False)
+        filenames = _list_files(self._data_dir)
 
         if self.skip_unlabeled:
-            filenames = [f for f in filenames if f in self._images_map]
+            filenames = sorted(self._images_map.keys() & set(filenames))
 
         self._filenames = self._preprocess_list(filenames)
         self._num_samples = len(self._filenames)
+        self._executor = ThreadPoolExecutor(max_workers=1)
 
     def get_dataset_info(self):
         return self._info
 
+    def close(self, *args):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+        self._next_future = None
+
+    def _submit_next(self):
+        if self._next_idx >= self._num_samples:
+            return None
+
+        filename = self._filenames[self._next_idx]
+        self._next_idx += 1
+
+        return self._executor.submit(self._load_sample, filename)
+
+    def _load_sample(self, filename):
+        image_path = os.path.join(self._data_dir, filename)
+
+        cvat_image = self._images_map.get(filename, None)
+        if cvat_image is not None:
+            # Labeled image
+            image_metadata = cvat_image.get_image_metadata()
+            labels = cvat_image.to_labels()
+        else:
+            # Unlabeled image
+            image_metadata = fom.ImageMetadata.build_for(image_path)
+            labels = None
+
+        return image_path, image_metadata, labels
+
 
 class CVATVideoDatasetImporter(foud.LabeledVideoDatasetImporter):
     """Importer for CVAT video datasets stored on disk.
@@ -276,6 +302,9 @@ class CVATVideoDatasetImporter(foud.LabeledVideoDatasetImporter):
         seed (None): a random seed to use when shuffling
         max_samples (None): a maximum number of samples to import. By default,
             all samples are imported
+        num_workers (None): an optional number of processes to use to parse
+            labels files ahead of the videos being imported. By default, labels
+            files are parsed serially in the calling process
     """
 
     def __init__(
@@ -285,6 +314,7 @@ class CVATVideoDatasetImporter(foud.LabeledVideoDatasetImporter):
         shuffle=False,
         seed=None,
         max_samples=None,
+        num_workers=None,
     ):
         super().__init__(
             dataset_dir,
@@ -293,40 +323,51 @@ class CVATVideoDatasetImporter(foud.LabeledVideoDatasetImporter):
             seed=seed,
             max_samples=max_samples,
         )
+        self.num_workers = num_workers
         self._info = None
         self._cvat_task_labels = None
         self._uuids_to_video_paths = None
         self._uuids_to_labels_paths = None
         self._uuids = None
-        self._iter_uuids = None
+        self._next_idx = None
         self._num_samples = None
+        self._executor = None
+        self._prefetched = None
+        self._annos_cache = None
 
     def __iter__(self):
-        self._iter_uuids = iter(self._uuids)
+        self._next_idx = 0
+        self._cancel_prefetched()
+        self._prefetch()
         return self
 
     def __len__(self):
         return self._num_samples
 
     def __next__(self):
-        uuid = next(self._iter_uuids)
+        if not self._prefetched:
+            raise StopIteration
+
+        uuid, labels_path, future = self._prefetched.popleft()
+        self._prefetch()
 
         video_path = self._uuids_to_video_paths[uuid]
 
-        labels_path = self._uuids_to_labels_paths.get(uuid, None)
         if labels_path:
             # Labeled video
-            info, cvat_task_labels, cvat_tracks = load_cvat_video_annotations(
-                labels_path
-            )
+            if future is not None:
+                anno, frames = future.result()
+                self._annos_cache.put(labels_path, anno)
+            else:
+                anno = self._annos_cache.load(labels_path)
+                frames = _cvat_tracks_to_frames_dict(anno[2])
+
+            info, cvat_task_labels, _ = anno
 
             if self._info is None:
-                self._info = info
+                self._info = dict(info)
 
             self._cvat_task_labels.merge_task_labels(cvat_task_labels)
-            self._info["task_labels"] = self._cvat_task_labels.labels
-
-            frames = _cvat_tracks_to_frames_dict(cvat_tracks)
         else:
             # Unlabeled video
             frames = None
@@ -359,8 +400,7 @@ class CVATVideoDatasetImporter(foud.LabeledVideoDatasetImporter):
         data_dir = os.path.join(self.dataset_dir, "data")
         if os.path.isdir(data_dir):
             self._uuids_to_video_paths = {
-                to_uuid(p): p
-                for p in etau.list_files(data_dir, abs_paths=True)
+                to_uuid(p): p for p in _list_files(data_dir, abs_paths=True)
             }
         else:
             self._uuids_to_video_paths = {}
@@ -368,8 +408,7 @@ class CVATVideoDatasetImporter(foud.LabeledVideoDatasetImporter):
         labels_dir = os.path.join(self.dataset_dir, "labels")
         if os.path.isdir(labels_dir):
             self._uuids_to_labels_paths = {
-                to_uuid(p): p
-                for p in etau.list_files(labels_dir, abs_paths=True)
+                to_uuid(p): p for p in _list_files(labels_dir, abs_paths=True)
             }
         else:
             self._uuids_to_labels_paths = {}
@@ -384,9 +423,78 @@ class CVATVideoDatasetImporter(foud.LabeledVideoDatasetImporter):
         self._num_samples = len(self._uuids)
         self._cvat_task_labels = CVATTaskLabels()
 
+        if (
+            self.num_workers is not None
+            and self.num_workers > 1
+            and self._uuids_to_labels_paths
+        ):
+            self._executor = ProcessPoolExecutor(max_workers=self.num_workers)
+
+        self._prefetched = deque()
+        self._annos_cache = _CVATVideoAnnotationsCache()
+
     def get_dataset_info(self):
+        # The merged task labels are only generated when they are requested
+        if self._info is not None:
+            self._info["task_labels"] = self._cvat_task_labels.labels
+
         return self._info
 
+    def clear_cache(self):
+        """Clears this importer's in-memory cache of recently parsed CVAT video
+        labels files.
+        """
+        if self._annos_cache is not None:
+            self._annos_cache.clear()
+
+    def close(self, *args):
+        self._cancel_prefetched()
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+        self._annos_cache = None
+
+    def _prefetch(self):
+        # Keeps a bounded window of labels files parsing in the background,
+        # in the order in which their videos will be imported
+        if self._executor is not None:
+            num_prefetch = 2 * self.num_workers
+        else:
+            num_prefetch = 1
+
+        while len(self._prefetched) < num_prefetch:
+            if self._next_idx >= self._num_samples:
+                break
+
+            uuid = self._uuids[self._next_idx]
+            self._next_idx += 1
+
+            labels_path = self._uuids_to_labels_paths.get(uuid, None)
+            if (
+                labels_path
+                and self._executor is not None
+                and self._annos_cache.get(labels_path) is None
+            ):
+                future = self._executor.submit(
+                    _load_cvat_video_labels, labels_path
+                )
+            else:
+                future = None
+
+            self._prefetched.append((uuid, labels_path, future))
+
+    def _cancel_prefetched(self):
+        if not self._prefetched:
+            return
+
+        for _, _, future in self._prefetched:
+            if future is not None:
+                future.cancel()
+
+        self._prefetched.clear()
+
 
 class CVATImageDatasetExporter(foud.LabeledImageDatasetExporter):
     """Exporter that writes CVAT image datasets to disk.
@@ -411,7 +519,10 @@ class CVATImageDatasetExporter(foud.LabeledImageDatasetExporter):
         self._task_labels = None
         self._data_dir = None
         self._labels_path = None
-        self._cvat_images = None
+        self._images_file = None
+        self._num_images = 0
+        self._schema = None
+        self._schema_seen = None
         self._filename_maker = None
 
     @property
@@ -429,7 +540,10 @@ class CVATImageDatasetExporter(foud.LabeledImageDatasetExporter):
     def setup(self):
         self._data_dir = os.path.join(self.export_dir, "data")
         self._labels_path = os.path.join(self.export_dir, "labels.xml")
-        self._cvat_images = []
+        self._images_file = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+        self._num_images = 0
+        self._schema = etai.ImageLabelsSchema()
+        self._schema_seen = set()
         self._filename_maker = fou.UniqueFilenameMaker(
             output_dir=self._data_dir, default_ext=self.image_format
         )
@@ -453,36 +567,48 @@ class CVATImageDatasetExporter(foud.LabeledImageDatasetExporter):
             return  # unlabeled
 
         if metadata is None:
-            metadata = fom.ImageMetadata.build_for(out_image_path)
+            # Build from the input, which avoids re-reading in-memory images
+            # from disk
+            metadata = fom.ImageMetadata.build_for(image_or_path)
 
         cvat_image = CVATImage.from_labels(labels, metadata)
 
-        cvat_image.id = len(self._cvat_images)
+        cvat_image.id = self._num_images
         cvat_image.name = os.path.basename(out_image_path)
 
-        self._cvat_images.append(cvat_image)
+        self._num_images += 1
+
+        if self._task_labels is None:
+            _add_cvat_annos_to_schema(
+                self._schema, cvat_image.iter_annos(), self._schema_seen
+            )
+
+        # Spool the serialized image to disk rather than keeping it in memory
+        self._images_file.write(_cvat_image_to_xml_str(cvat_image))
 
     def close(self, *args):
         # Get task labels
         if self._task_labels is None:
             # Compute task labels from active label schema
-            cvat_task_labels = CVATTaskLabels.from_cvat_images(
-                self._cvat_images
-            )
+            cvat_task_labels = CVATTaskLabels.from_schema(self._schema)
         else:
             # Use task labels from logged collection info
             cvat_task_labels = CVATTaskLabels(labels=self._task_labels)
 
         # Write annotations
+        self._images_file.seek(0)
         writer = CVATImageAnnotationWriter()
-        writer.write(
+        writer.write_image_strs(
             cvat_task_labels,
-            self._cvat_images,
+            self._num_images,
+            self._images_file,
             self._labels_path,
             id=0,
             name=self._name,
         )
 
+        self._images_file.close()
+
 
 class CVATVideoDatasetExporter(foud.LabeledVideoDatasetExporter):
     """Exporter that writes CVAT video datasets to disk.
@@ -595,18 +721,41 @@ class CVATTaskLabels(object):
     """
 
     def __init__(self, labels=None):
+        self._labels = None
+        self._schema = None
         self.labels = labels or []
 
+    @property
+    def labels(self):
+        """The list of label dicts."""
+        if self._labels is None:
+            self._labels = _schema_to_labels(self._schema)
+
+            # The returned list may be modified in-place, so it is the source
+            # of truth from now on
+            self._schema = None
+
+        return self._labels
+
+    @labels.setter
+    def labels(self, labels):
+        self._labels = labels
+        self._schema = None
+
     def merge_task_labels(self, task_labels):
         """Merges the given :class:`CVATTaskLabels` into this instance.
 
         Args:
             task_labels: a :class:`CVATTaskLabels`
         """
-        schema = self.to_schema()
-        schema.merge_schema(task_labels.to_schema())
-        new_task_labels = CVATTaskLabels.from_schema(schema)
-        self.labels = new_task_labels.labels
+        # Merge into a schema and only regenerate the label dicts when they are
+        # next accessed, so that repeated merges are cheap. The schema is
+        # discarded when the label dicts are regenerated
+        if self._schema is None:
+            self._schema = self.to_schema()
+
+        self._schema.merge_schema(task_labels.to_schema())
+        self._labels = None
 
     def to_schema(self):
         """Returns an ``eta.core.image.ImageLabelsSchema`` representation of
@@ -619,6 +768,9 @@ class CVATTaskLabels(object):
         Returns:
             an ``eta.core.image.ImageLabelsSchema``
         """
+        if self._schema is not None:
+            return self._schema.copy()
+
         schema = etai.ImageLabelsSchema()
 
         for label in self.labels:
@@ -645,17 +797,9 @@ class CVATTaskLabels(object):
             a :class:`CVATTaskLabels`
         """
         schema = etai.ImageLabelsSchema()
+        seen = set()
         for cvat_image in cvat_images:
-            for anno in cvat_image.iter_annos():
-                _label = anno.label
-                schema.add_object_label(_label)
-
-                if anno.occluded is not None:
-                    schema.add_object_attribute("occluded", anno.occluded)
-
-                for attr in anno.attributes:
-                    _attr = attr.to_eta_attribute()
-                    schema.add_object_attribute(_label, _attr)
+            _add_cvat_annos_to_schema(schema, cvat_image.iter_annos(), seen)
 
         return cls.from_schema(schema)
 
@@ -671,23 +815,9 @@ class CVATTaskLabels(object):
             a :class:`CVATTaskLabels`
         """
         schema = etai.ImageLabelsSchema()
+        seen = set()
         for cvat_track in cvat_tracks:
-            for anno in cvat_track.iter_annos():
-                _label = anno.label
-                schema.add_object_label(_label)
-
-                if anno.outside is not None:
-                    schema.add_object_attribute("outside", anno.outside)
-
-                if anno.occluded is not None:
-                    schema.add_object_attribute("occluded", anno.occluded)
-
-                if anno.keyframe is not None:
-                    schema.add_object_attribute("keyframe", anno.keyframe)
-
-                for attr in anno.attributes:
-                    _attr = attr.to_eta_attribute()
-                    schema.add_object_attribute(_label, _attr)
+            _add_cvat_annos_to_schema(schema, cvat_track.iter_annos(), seen)
 
         return cls.from_schema(schema)
 
@@ -702,11 +832,11 @@ class CVATTaskLabels(object):
         Returns:
             a :class:`CVATTaskLabels`
         """
-        labels = _ensure_list(d.get("label", []))
+        labels = _ensure_list(d.get("label"))
         _labels = []
         for label in labels:
             _tmp = label.get("attributes", None) or {}
-            attributes = _ensure_list(_tmp.get("attribute", []))
+            attributes = _ensure_list(_tmp.get("attribute"))
             _attributes = []
             for attribute in attributes:
                 _attributes.append(
@@ -731,25 +861,7 @@ class CVATTaskLabels(object):
         Returns:
             a :class:`CVATTaskLabels`
         """
-        labels = []
-        obj_schemas = schema.objects
-        for label in sorted(obj_schemas.schema):
-            obj_schema = obj_schemas.schema[label]
-            obj_attr_schemas = obj_schema.attrs
-            attributes = []
-            for name in sorted(obj_attr_schemas.schema):
-                attr_schema = obj_attr_schemas.schema[name]
-                if isinstance(attr_schema, etad.CategoricalAttributeSchema):
-                    attributes.append(
-                        {
-                            "name": name,
-                            "categories": sorted(attr_schema.categories),
-                        }
-                    )
-
-            labels.append({"name": label, "attributes": attributes})
-
-        return cls(labels=labels)
+        return cls(labels=_schema_to_labels(schema))
 
 
 class CVATImage(object):
@@ -833,7 +945,7 @@ class CVATImage(object):
         labels = {}
 
         if self.boxes:
-            detections = [b.to_detection(frame_size) for b in self.boxes]
+            detections = _boxes_to_detections(self.boxes, frame_size)
             labels["detections"] = fol.Detections(detections=detections)
 
         if self.polygons or self.polylines:
@@ -864,36 +976,33 @@ class CVATImage(object):
         height = metadata.height
 
         _detections = []
-        _polygons = []
-        _polylines = []
+        _polys = []
         _keypoints = []
+        _label_lists = {
+            "detections": _detections,
+            "polylines": _polys,
+            "keypoints": _keypoints,
+        }
         for _labels in labels.values():
-            if isinstance(_labels, fol.Detection):
-                _detections.append(_labels)
-            elif isinstance(_labels, fol.Detections):
-                _detections.extend(_labels.detections)
-            elif isinstance(_labels, fol.Polyline):
-                if _labels.closed:
-                    _polygons.append(_labels)
-                else:
-                    _polylines.append(_labels)
-            elif isinstance(_labels, fol.Polylines):
-                for poly in _labels.polylines:
-                    if poly.closed:
-                        _polygons.append(poly)
-                    else:
-                        _polylines.append(poly)
-            elif isinstance(_labels, fol.Keypoint):
-                _keypoints.append(_labels)
-            elif isinstance(_labels, fol.Keypoints):
-                _keypoints.extend(_labels.keypoints)
-            elif _labels is not None:
+            if _labels is None:
+                continue
+
+            handler = _get_by_type(_IMAGE_LABEL_HANDLERS, _labels)
+            if handler is None:
                 msg = (
                     "Ignoring unsupported label type '%s'" % _labels.__class__
                 )
                 warnings.warn(msg)
+                continue
+
+            key, get_labels = handler
+            _label_lists[key].extend(get_labels(_labels))
+
+        _polygons = [p for p in _polys if p.closed]
+        _polylines = [p for p in _polys if not p.closed]
 
-        boxes = [CVATImageBox.from_detection(d, metadata) for d in _detections]
+        frame_size = (width, height)
+        boxes = CVATImageBox._from_detections(_detections, frame_size)
 
         polygons = []
         for p in _polygons:
@@ -934,21 +1043,21 @@ class CVATImage(object):
         width = int(d["@width"])
         height = int(d["@height"])
 
-        boxes = []
-        for bd in _ensure_list(d.get("box", [])):
-            boxes.append(CVATImageBox.from_box_dict(bd))
+        from_box_dict = CVATImageBox.from_box_dict
+        boxes = [from_box_dict(bd) for bd in _ensure_list(d.get("box"))]
 
-        polygons = []
-        for pd in _ensure_list(d.get("polygon", [])):
-            polygons.append(CVATImagePolygon.from_polygon_dict(pd))
+        from_polygon_dict = CVATImagePolygon.from_polygon_dict
+        polygons = [
+            from_polygon_dict(pd) for pd in _ensure_list(d.get("polygon"))
+        ]
 
-        polylines = []
-        for pd in _ensure_list(d.get("polyline", [])):
-            polylines.append(CVATImagePolyline.from_polyline_dict(pd))
+        from_polyline_dict = CVATImagePolyline.from_polyline_dict
+        polylines = [
+            from_polyline_dict(pd) for pd in _ensure_list(d.get("polyline"))
+        ]
 
-        points = []
-        for pd in _ensure_list(d.get("points", [])):
-            points.append(CVATImagePoints.from_points_dict(pd))
+        from_points_dict = CVATImagePoints.from_points_dict
+        points = [from_points_dict(pd) for pd in _ensure_list(d.get("points"))]
 
         return cls(
             id,
@@ -979,31 +1088,40 @@ class HasCVATPoints(object):
 
     @staticmethod
     def _to_rel_points(points, frame_size):
-        width, height = frame_size
-        rel_points = [(x / width, y / height) for x, y in points]
-        return rel_points
+        if len(points) < _MIN_NUMPY_POINTS:
+            w, h = frame_size
+            return [(x / w, y / h) for x, y in points]
+
+        # `np.array()` always copies, so the conversion can be done in-place
+        rel_points = np.array(points, dtype=float).reshape(-1, 2)
+        rel_points /= frame_size
+        return list(map(tuple, rel_points.tolist()))
 
     @staticmethod
     def _to_abs_points(points, frame_size):
-        width, height = frame_size
-        abs_points = []
-        for x, y in points:
-            abs_points.append((int(round(x * width)), int(round(y * height))))
+        if len(points) < _MIN_NUMPY_POINTS:
+            w, h = frame_size
+            return [(round(x * w), round(y * h)) for x, y in points]
 
-        return abs_points
+        abs_points = np.array(points, dtype=float).reshape(-1, 2)
+        abs_points *= frame_size
+        np.rint(abs_points, out=abs_points)
+        return list(map(tuple, abs_points.astype(int).tolist()))
 
     @staticmethod
     def _to_cvat_points_str(points):
-        return ";".join("%g,%g" % (x, y) for x, y in points)
+        return ";".join("%s,%s" % (x, y) for x, y in points)
 
     @staticmethod
     def _parse_cvat_points_str(points_str):
-        points = []
-        for xy_str in points_str.split(";"):
-            x, y = xy_str.split(",")
-            points.append((int(round(float(x))), int(round(float(y)))))
+        # Unlike `np.fromstring()`, this raises on malformed coordinates rather
+        # than silently dropping them
+        points = np.array(points_str.replace(";", ",").split(","), dtype=float)
+        if points.size != 2 * (points_str.count(";") + 1):
+            raise ValueError("Invalid CVAT points string '%s'" % points_str)
 
-        return points
+        points = np.rint(points).astype(int).reshape(-1, 2)
+        return list(map(tuple, points.tolist()))
 
 
 class CVATImageAnno(object):
@@ -1017,14 +1135,15 @@ class CVATImageAnno(object):
     def __init__(self, occluded=None, attributes=None):
         self.occluded = occluded
         self.attributes = attributes or []
+        self._attr_specs = None
 
     def _to_attributes(self):
-        attributes = {a.name: a.to_attribute() for a in self.attributes}
-
-        if self.occluded is not None:
-            attributes["occluded"] = fol.BooleanAttribute(value=self.occluded)
+        if self._attr_specs is None:
+            self._attr_specs = _get_attribute_specs(
+                self.attributes, occluded=self.occluded
+            )
 
-        return attributes
+        return _make_attributes(self._attr_specs)
 
     @staticmethod
     def _parse_attributes(label):
@@ -1050,20 +1169,9 @@ class CVATImageAnno(object):
 
     @staticmethod
     def _parse_anno_dict(d):
-        occluded = d.get("@occluded", None)
-        if occluded is not None:
-            occluded = bool(int(occluded))
+        occluded = _parse_bool_str(d.get("@occluded", None))
 
-        attributes = []
-        for attr in _ensure_list(d.get("attribute", [])):
-            name = attr["@name"].lstrip("@")
-            value = attr["#text"]
-            try:
-                value = float(value)
-            except:
-                pass
-
-            attributes.append(CVATAttribute(name, value))
+        attributes = _parse_attribute_dicts(d.get("attribute", None))
 
         return occluded, attributes
 
@@ -1146,6 +1254,32 @@ class CVATImageBox(CVATImageAnno):
             label, xtl, ytl, xbr, ybr, occluded=occluded, attributes=attributes
         )
 
+    @classmethod
+    def _from_detections(cls, detections, frame_size):
+        # Batch version of `from_detection()` that converts the coordinates
+        # of all boxes at once
+        if not detections:
+            return []
+
+        bboxes = np.array([d.bounding_box for d in detections], dtype=float)
+        bboxes[:, 2:] += bboxes[:, :2]
+        bboxes *= np.tile(np.asarray(frame_size, dtype=float), 2)
+        coords = np.rint(bboxes).astype(int).tolist()
+
+        boxes = []
+        for detection, xyxy in zip(detections, coords):
+            occluded, attributes = cls._parse_attributes(detection)
+            boxes.append(
+                cls(
+                    detection.label,
+                    *xyxy,
+                    occluded=occluded,
+                    attributes=attributes,
+                )
+            )
+
+        return boxes
+
     @classmethod
     def from_box_dict(cls, d):
         """Creates a :class:`CVATImageBox` from a ``<box>`` tag of a CVAT image
@@ -1157,12 +1291,12 @@ class CVATImageBox(CVATImageAnno):
         Returns:
             a :class:`CVATImageBox`
         """
-        label = d["@label"]
+        label = sys.intern(d["@label"])
 
-        xtl = int(round(float(d["@xtl"])))
-        ytl = int(round(float(d["@ytl"])))
-        xbr = int(round(float(d["@xbr"])))
-        ybr = int(round(float(d["@ybr"])))
+        xtl = round(float(d["@xtl"]))
+        ytl = round(float(d["@ytl"]))
+        xbr = round(float(d["@xbr"]))
+        ybr = round(float(d["@ybr"]))
 
         occluded, attributes = cls._parse_anno_dict(d)
 
@@ -1258,7 +1392,7 @@ class CVATImagePolygon(CVATImageAnno, HasCVATPoints):
         Returns:
             a :class:`CVATImagePolygon`
         """
-        label = d["@label"]
+        label = sys.intern(d["@label"])
         points = cls._parse_cvat_points_str(d["@points"])
         occluded, attributes = cls._parse_anno_dict(d)
 
@@ -1334,7 +1468,7 @@ class CVATImagePolyline(CVATImageAnno, HasCVATPoints):
         for points in polyline.points:
             abs_points = cls._to_abs_points(points, frame_size)
             if abs_points and polyline.closed:
-                abs_points.append(copy(abs_points[0]))
+                abs_points.append(abs_points[0])
 
             polylines.append(
                 cls(
@@ -1355,7 +1489,7 @@ class CVATImagePolyline(CVATImageAnno, HasCVATPoints):
         Returns:
             a :class:`CVATImagePolyline`
         """
-        label = d["@label"]
+        label = sys.intern(d["@label"])
         points = cls._parse_cvat_points_str(d["@points"])
         occluded, attributes = cls._parse_anno_dict(d)
 
@@ -1426,7 +1560,7 @@ class CVATImagePoints(CVATImageAnno, HasCVATPoints):
         Returns:
             a :class:`CVATImagePoints`
         """
-        label = d["@label"]
+        label = sys.intern(d["@label"])
         points = cls._parse_cvat_points_str(d["@points"])
         occluded, attributes = cls._parse_anno_dict(d)
         return cls(label, points, occluded=occluded, attributes=attributes)
@@ -1512,8 +1646,10 @@ class CVATTrack(object):
 
         # Only one of these will actually contain labels
 
-        for frame_number, box in self.boxes.items():
-            detection = box.to_detection(frame_size)
+        detections = _boxes_to_detections(
+            list(self.boxes.values()), frame_size
+        )
+        for frame_number, detection in zip(self.boxes, detections):
             detection.index = self.id
             labels[frame_number] = detection
 
@@ -1549,34 +1685,46 @@ class CVATTrack(object):
         """
         width, height = frame_size
 
-        boxes = {}
-        polygons = {}
-        polylines = {}
-        points = {}
+        detections = {}
+        _polylines = {}
+        keypoints = {}
+        _label_dicts = {
+            "detections": detections,
+            "polylines": _polylines,
+            "keypoints": keypoints,
+        }
         label = None
         for frame_number, _label in labels.items():
             label = _label.label
 
-            if isinstance(_label, fol.Detection):
-                boxes[frame_number] = CVATVideoBox.from_detection(
-                    frame_number, _label, frame_size
-                )
-            elif isinstance(_label, fol.Polyline):
-                if _label.filled:
-                    polygons[frame_number] = CVATVideoPolygon.from_polyline(
-                        frame_number, _label, frame_size
-                    )
-                else:
-                    polylines[frame_number] = CVATVideoPolyline.from_polyline(
-                        frame_number, _label, frame_size
-                    )
-            elif isinstance(_label, fol.Keypoint):
-                points[frame_number] = CVATVideoPoints.from_keypoint(
-                    frame_number, _label, frame_size
-                )
-            elif _label is not None:
+            key = _get_by_type(_TRACK_LABEL_KEYS, _label)
+            if key is None:
                 msg = "Ignoring unsupported label type '%s'" % _label.__class__
                 warnings.warn(msg)
+                continue
+
+            _label_dicts[key][frame_number] = _label
+
+        boxes = CVATVideoBox._from_detections(detections, frame_size)
+
+        polygons = {}
+        polylines = {}
+        for frame_number, polyline in _polylines.items():
+            if polyline.filled:
+                polygons[frame_number] = CVATVideoPolygon.from_polyline(
+                    frame_number, polyline, frame_size
+                )
+            else:
+                polylines[frame_number] = CVATVideoPolyline.from_polyline(
+                    frame_number, polyline, frame_size
+                )
+
+        points = {
+            frame_number: CVATVideoPoints.from_keypoint(
+                frame_number, keypoint, frame_size
+            )
+            for frame_number, keypoint in keypoints.items()
+        }
 
         return cls(
             id,
@@ -1602,27 +1750,27 @@ class CVATTrack(object):
             a :class:`CVATTrack`
         """
         id = d["@id"]
-        label = d["@label"]
+        label = sys.intern(d["@label"])
 
         width, height = frame_size
 
         boxes = {}
-        for bd in _ensure_list(d.get("box", [])):
+        for bd in _ensure_list(d.get("box")):
             box = CVATVideoBox.from_box_dict(label, bd)
             boxes[box.frame] = box
 
         polygons = {}
-        for pd in _ensure_list(d.get("polygon", [])):
+        for pd in _ensure_list(d.get("polygon")):
             polygon = CVATVideoPolygon.from_polygon_dict(label, pd)
             polygons[polygon.frame] = polygon
 
         polylines = {}
-        for pd in _ensure_list(d.get("polyline", [])):
+        for pd in _ensure_list(d.get("polyline")):
             polyline = CVATVideoPolyline.from_polyline_dict(label, pd)
             polylines[polyline.frame] = polyline
 
         points = {}
-        for pd in _ensure_list(d.get("points", [])):
+        for pd in _ensure_list(d.get("points")):
             point = CVATVideoPoints.from_points_dict(label, pd)
             points[point.frame] = point
 
@@ -1655,20 +1803,18 @@ class CVATVideoAnno(object):
         self.occluded = occluded
         self.keyframe = keyframe
         self.attributes = attributes or []
+        self._attr_specs = None
 
     def _to_attributes(self):
-        attributes = {a.name: a.to_attribute() for a in self.attributes}
-
-        if self.outside is not None:
-            attributes["outside"] = fol.BooleanAttribute(value=self.outside)
-
-        if self.occluded is not None:
-            attributes["occluded"] = fol.BooleanAttribute(value=self.occluded)
-
-        if self.keyframe is not None:
-            attributes["keyframe"] = fol.BooleanAttribute(value=self.keyframe)
+        if self._attr_specs is None:
+            self._attr_specs = _get_attribute_specs(
+                self.attributes,
+                outside=self.outside,
+                occluded=self.occluded,
+                keyframe=self.keyframe,
+            )
 
-        return attributes
+        return _make_attributes(self._attr_specs)
 
     @staticmethod
     def _parse_attributes(label):
@@ -1700,28 +1846,10 @@ class CVATVideoAnno(object):
 
     @staticmethod
     def _parse_anno_dict(d):
-        outside = d.get("@outside", None)
-        if outside is not None:
-            outside = bool(int(outside))
-
-        occluded = d.get("@occluded", None)
-        if occluded is not None:
-            occluded = bool(int(occluded))
-
-        keyframe = d.get("@keyframe", None)
-        if keyframe is not None:
-            keyframe = bool(int(keyframe))
-
-        attributes = []
-        for attr in _ensure_list(d.get("attribute", [])):
-            name = attr["@name"].lstrip("@")
-            value = attr["#text"]
-            try:
-                value = float(value)
-            except:
-                pass
-
-            attributes.append(CVATAttribute(name, value))
+        outside = _parse_bool_str(d.get("@outside", None))
+        occluded = _parse_bool_str(d.get("@occluded", None))
+        keyframe = _parse_bool_str(d.get("@keyframe", None))
+        attributes = _parse_attribute_dicts(d.get("attribute", None))
 
         return outside, occluded, keyframe, attributes
 
@@ -1834,6 +1962,37 @@ class CVATVideoBox(CVATVideoAnno):
             attributes=attributes,
         )
 
+    @classmethod
+    def _from_detections(cls, detections, frame_size):
+        # Batch version of `from_detection()` that converts the coordinates
+        # of all boxes at once
+        if not detections:
+            return {}
+
+        bboxes = np.array(
+            [d.bounding_box for d in detections.values()], dtype=float
+        )
+        bboxes[:, 2:] += bboxes[:, :2]
+        bboxes *= np.tile(np.asarray(frame_size, dtype=float), 2)
+        coords = np.rint(bboxes).astype(int).tolist()
+
+        boxes = {}
+        for (frame_number, detection), xyxy in zip(detections.items(), coords):
+            outside, occluded, keyframe, attributes = cls._parse_attributes(
+                detection
+            )
+            boxes[frame_number] = cls(
+                frame_number,
+                detection.label,
+                *xyxy,
+                outside=outside,
+                occluded=occluded,
+                keyframe=keyframe,
+                attributes=attributes,
+            )
+
+        return boxes
+
     @classmethod
     def from_box_dict(cls, label, d):
         """Creates a :class:`CVATVideoBox` from a ``<box>`` tag of a CVAT video
@@ -1848,10 +2007,10 @@ class CVATVideoBox(CVATVideoAnno):
         """
         frame = int(d["@frame"])
 
-        xtl = int(round(float(d["@xtl"])))
-        ytl = int(round(float(d["@ytl"])))
-        xbr = int(round(float(d["@xbr"])))
-        ybr = int(round(float(d["@ybr"])))
+        xtl = round(float(d["@xtl"]))
+        ytl = round(float(d["@ytl"]))
+        xbr = round(float(d["@xbr"]))
+        ybr = round(float(d["@ybr"]))
 
         outside, occluded, keyframe, attributes = cls._parse_anno_dict(d)
 
@@ -2057,7 +2216,9 @@ class CVATVideoPolyline(CVATVideoAnno, HasCVATPoints):
         points = _get_single_polyline_points(polyline)
         points = cls._to_abs_points(points, frame_size)
         if points and polyline.closed:
-            points.append(copy(points[0]))
+            # `_to_abs_points()` returns immutable tuples, so the first point
+            # can be reused
+            points.append(points[0])
 
         outside, occluded, keyframe, attributes = cls._parse_attributes(
             polyline
@@ -2221,13 +2382,8 @@ class CVATAttribute(object):
         Returns:
             an ``eta.core.data.Attribute``
         """
-        if isinstance(self.value, bool):
-            return etad.BooleanAttribute(self.name, self.value)
-
-        if etau.is_numeric(self.value):
-            return etad.NumericAttribute(self.name, self.value)
-
-        return etad.CategoricalAttribute(self.name, self.value)
+        eta_attr_cls, _ = _get_attribute_classes(self.value)
+        return eta_attr_cls(self.name, self.value)
 
     def to_attribute(self):
         """Returns a :class:`fiftyone.core.labels.Attribute` representation of
@@ -2236,13 +2392,12 @@ class CVATAttribute(object):
         Returns:
             a :class:`fiftyone.core.labels.Attribute`
         """
-        if isinstance(self.value, bool):
-            return fol.BooleanAttribute(value=self.value)
+        _, attr_cls, value = self._to_attribute_spec()
+        return attr_cls(value=value)
 
-        if etau.is_numeric(self.value):
-            return fol.NumericAttribute(value=self.value)
-
-        return fol.CategoricalAttribute(value=self.value)
+    def _to_attribute_spec(self):
+        _, attr_cls = _get_attribute_classes(self.value)
+        return self.name, attr_cls, self.value
 
 
 class CVATImageAnnotationWriter(object):
@@ -2252,16 +2407,6 @@ class CVATImageAnnotationWriter(object):
     details.
     """
 
-    def __init__(self):
-        environment = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(foc.RESOURCES_DIR),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        self.template = environment.get_template(
-            "cvat_image_annotation_template.xml"
-        )
-
     def write(
         self, cvat_task_labels, cvat_images, xml_path, id=None, name=None
     ):
@@ -2274,20 +2419,44 @@ class CVATImageAnnotationWriter(object):
             id (None): an ID for the task
             name (None): a name for the task
         """
-        now = datetime.now().isoformat()
-        xml_str = self.template.render(
-            {
-                "id": id if id is not None else "",
-                "name": name if name is not None else "",
-                "size": len(cvat_images),
-                "created": now,
-                "updated": now,
-                "labels": cvat_task_labels.labels,
-                "dumped": now,
-                "images": cvat_images,
-            }
+        image_strs = (_cvat_image_to_xml_str(i) for i in cvat_images)
+        self.write_image_strs(
+            cvat_task_labels,
+            len(cvat_images),
+            image_strs,
+            xml_path,
+            id=id,
+            name=name,
+        )
+
+    def write_image_strs(
+        self,
+        cvat_task_labels,
+        num_images,
+        image_strs,
+        xml_path,
+        id=None,
+        name=None,
+    ):
+        """Writes annotations whose ``<image>`` tags have already been
+        serialized to disk.
+
+        The images are written as they are read from ``image_strs``, so the
+        full XML document is never held in memory.
+
+        Args:
+            cvat_task_labels: a :class:`CVATTaskLabels` instance
+            num_images: the number of images in ``image_strs``
+            image_strs: an iterable of ``<image>`` XML strings, such as a file
+                object
+            xml_path: the path to write the annotations XML file
+            id (None): an ID for the task
+            name (None): a name for the task
+        """
+        meta = _make_cvat_meta_element(
+            cvat_task_labels, num_images, "annotation", id=id, name=name
         )
-        etau.write_file(xml_str, xml_path)
+        _write_cvat_annotations(xml_path, meta, image_strs)
 
 
 class CVATVideoAnnotationWriter(object):
@@ -2297,16 +2466,6 @@ class CVATVideoAnnotationWriter(object):
     details.
     """
 
-    def __init__(self):
-        environment = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(foc.RESOURCES_DIR),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        self.template = environment.get_template(
-            "cvat_video_interpolation_template.xml"
-        )
-
     def write(
         self,
         cvat_task_labels,
@@ -2327,25 +2486,19 @@ class CVATVideoAnnotationWriter(object):
             id (None): an ID for the task
             name (None): a name for the task
         """
-        now = datetime.now().isoformat()
-        xml_str = self.template.render(
-            {
-                "id": id if id is not None else "",
-                "name": name if name is not None else "",
-                "size": metadata.total_frame_count,
-                "created": now,
-                "updated": now,
-                "width": metadata.frame_width,
-                "height": metadata.frame_height,
-                "labels": cvat_task_labels.labels,
-                "dumped": now,
-                "tracks": cvat_tracks,
-            }
+        meta = _make_cvat_meta_element(
+            cvat_task_labels,
+            metadata.total_frame_count,
+            "interpolation",
+            id=id,
+            name=name,
+            original_size=(metadata.frame_width, metadata.frame_height),
         )
-        etau.write_file(xml_str, xml_path)
+        track_strs = (_cvat_track_to_xml_str(t) for t in cvat_tracks)
+        _write_cvat_annotations(xml_path, meta, track_strs)
 
 
-def load_cvat_image_annotations(xml_path):
+def load_cvat_image_annotations(xml_path, lazy=False):
     """Loads the CVAT image annotations from the given XML file.
 
     See :class:`fiftyone.types.dataset_types.CVATImageDataset` for format
@@ -2353,19 +2506,31 @@ def load_cvat_image_annotations(xml_path):
 
     Args:
         xml_path: the path to the annotations XML file
+        lazy (False): whether to return a generator that parses the
+            ``<image>`` tags of the file one at a time, rather than a list
 
     Returns:
         a tuple of
 
         -   info: a dict of dataset info
         -   cvat_task_labels: a :class:`CVATTaskLabels` instance
-        -   cvat_images: a list of :class:`CVATImage` instances
+        -   cvat_images: a list (or generator, if ``lazy`` is True) of
+            :class:`CVATImage` instances
     """
-    d = fou.load_xml_as_json_dict(xml_path)
-    annotations = d.get("annotations", {})
+    info, cvat_task_labels, cvat_images = _parse_cvat_image_annotations(
+        xml_path
+    )
+
+    if not lazy:
+        cvat_images = list(cvat_images)
+
+    return info, cvat_task_labels, cvat_images
+
+
+def _parse_cvat_image_annotations(xml_path):
+    version, meta, image_dicts = _parse_cvat_annotations(xml_path, "image")
 
     # Verify version
-    version = annotations.get("version", None)
     if version is None:
         logger.warning("No version tag found; assuming version 1.1")
     elif version != "1.1":
@@ -2375,17 +2540,13 @@ def load_cvat_image_annotations(xml_path):
             version,
         )
 
-    # Load meta
-    meta = annotations.get("meta", {})
-
     # Load task labels
     task = meta.get("task", {})
     labels_dict = task.get("labels", {})
     cvat_task_labels = CVATTaskLabels.from_labels_dict(labels_dict)
 
-    # Load annotations
-    image_dicts = _ensure_list(annotations.get("image", []))
-    cvat_images = [CVATImage.from_image_dict(id) for id in image_dicts]
+    # Load annotations lazily
+    cvat_images = (CVATImage.from_image_dict(id) for id in image_dicts)
 
     # Load dataset info
     info = {"task_labels": cvat_task_labels.labels}
@@ -2401,7 +2562,7 @@ def load_cvat_image_annotations(xml_path):
     return info, cvat_task_labels, cvat_images
 
 
-def load_cvat_video_annotations(xml_path):
+def load_cvat_video_annotations(xml_path, num_workers=None):
     """Loads the CVAT video annotations from the given XML file.
 
     See :class:`fiftyone.types.dataset_types.CVATVideoDataset` for format
@@ -2409,6 +2570,9 @@ def load_cvat_video_annotations(xml_path):
 
     Args:
         xml_path: the path to the annotations XML file
+        num_workers (None): the number of processes to use to parse the
+            ``<track>`` tags of the file. By default, tracks are parsed in the
+            calling process
 
     Returns:
         a tuple of
@@ -2417,11 +2581,9 @@ def load_cvat_video_annotations(xml_path):
         -   cvat_task_labels: a :class:`CVATTaskLabels` instance
         -   cvat_tracks: a list of :class:`CVATTrack` instances
     """
-    d = fou.load_xml_as_json_dict(xml_path)
-    annotations = d.get("annotations", {})
+    version, meta, track_dicts = _parse_cvat_annotations(xml_path, "track")
 
     # Verify version
-    version = annotations.get("version", None)
     if version is None:
         logger.warning("No version tag found; assuming version 1.1")
     elif version != "1.1":
@@ -2431,25 +2593,31 @@ def load_cvat_video_annotations(xml_path):
             version,
         )
 
-    # Load meta
-    meta = annotations.get("meta", {})
-
     # Load task labels
     task = meta.get("task", {})
     labels_dict = task.get("labels", {})
     cvat_task_labels = CVATTaskLabels.from_labels_dict(labels_dict)
 
     # Load annotations
-    track_dicts = _ensure_list(annotations.get("track", []))
-    if track_dicts:
+    first_track = next(track_dicts, None)
+    if first_track is not None:
         original_size = task["original_size"]
         frame_size = (
             int(original_size["width"]),
             int(original_size["height"]),
         )
-        cvat_tracks = [
-            CVATTrack.from_track_dict(td, frame_size) for td in track_dicts
-        ]
+
+        track_dicts = itertools.chain([first_track], track_dicts)
+        parse_track = partial(CVATTrack.from_track_dict, frame_size=frame_size)
+
+        if num_workers is not None and num_workers > 1:
+            # Tracks are independent, so they can be parsed in parallel
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                cvat_tracks = list(
+                    executor.map(parse_track, track_dicts, chunksize=32)
+                )
+        else:
+            cvat_tracks = [parse_track(td) for td in track_dicts]
     else:
         cvat_tracks = []
 
@@ -2467,6 +2635,318 @@ def load_cvat_video_annotations(xml_path):
     return info, cvat_task_labels, cvat_tracks
 
 
+def _schema_to_labels(schema):
+    labels = []
+    obj_schemas = schema.objects
+    for label in sorted(obj_schemas.schema):
+        obj_schema = obj_schemas.schema[label]
+        obj_attr_schemas = obj_schema.attrs
+        attributes = []
+        for name in sorted(obj_attr_schemas.schema):
+            attr_schema = obj_attr_schemas.schema[name]
+            if isinstance(attr_schema, etad.CategoricalAttributeSchema):
+                attributes.append(
+                    {
+                        "name": name,
+                        "categories": sorted(attr_schema.categories),
+                    }
+                )
+
+        labels.append({"name": label, "attributes": attributes})
+
+    return labels
+
+
+def _parse_cvat_annotations(xml_path, tag):
+    # Streams the top-level elements of the <annotations> tag, so that only
+    # one <image>/<track> element is in memory at a time. CVAT files list
+    # <version> and <meta> before any annotations
+    elements = _iter_cvat_xml_elements(xml_path, {"version", "meta", tag})
+
+    version = None
+    meta = None
+    first = None
+    for _tag, d in elements:
+        if _tag == "version":
+            version = d
+        elif _tag == "meta":
+            meta = d
+        else:
+            first = (_tag, d)
+            break
+
+    def _iter_dicts():
+        if first is None:
+            return
+
+        for _tag, d in itertools.chain([first], elements):
+            if _tag == tag:
+                yield d
+
+    return version, meta or {}, _iter_dicts()
+
+
+def _iter_cvat_xml_elements(xml_path, tags):
+    # Only elements with the given tags are converted to dicts; all others are
+    # discarded as soon as they have been parsed
+    root = None
+    depth = 0
+    for event, elem in ET.iterparse(xml_path, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth == 1:
+            if elem.tag in tags:
+                yield elem.tag, _elem_to_dict(elem)
+
+            # Discard the element now that it has been parsed
+            root.clear()
+
+
+def _elem_to_dict(elem):
+    # Mirrors the format of `fiftyone.core.utils.load_xml_as_json_dict()`,
+    # except that tags in `_CVAT_LIST_TAGS` are always stored as lists, like
+    # xmltodict's `force_list` option
+    d = {"@" + k: v for k, v in elem.attrib.items()}
+
+    for child in elem:
+        value = _elem_to_dict(child)
+        tag = child.tag
+        if tag in _CVAT_LIST_TAGS:
+            d.setdefault(tag, []).append(value)
+        elif tag not in d:
+            d[tag] = value
+        elif isinstance(d[tag], list):
+            d[tag].append(value)
+        else:
+            d[tag] = [d[tag], value]
+
+    text = elem.text.strip() if elem.text else None
+    if text:
+        if not d:
+            return text
+
+        d["#text"] = text
+
+    return d or None
+
+
+# Shapes with fewer points than this are converted in pure Python, which is
+# faster than NumPy for small inputs
+_MIN_NUMPY_POINTS = 8
+
+
+# Tags that may be repeated within their parent tag
+_CVAT_LIST_TAGS = {
+    "box",
+    "polygon",
+    "polyline",
+    "points",
+    "attribute",
+    "label",
+}
+
+
+def _add_cvat_annos_to_schema(schema, annos, seen):
+    # `seen` tracks the labels and attributes that have already been added to
+    # `schema`, so that repeated values only cost a set lookup
+    intern = sys.intern
+    for anno in annos:
+        _label = intern(anno.label)
+        if _label not in seen:
+            schema.add_object_label(_label)
+            seen.add(_label)
+
+        for name in ("outside", "occluded", "keyframe"):
+            value = getattr(anno, name, None)
+            if value is not None:
+                schema.add_object_attribute(name, value)
+
+        for attr in anno.attributes:
+            key = (_label, intern(attr.name), type(attr.value), attr.value)
+            if key not in seen:
+                schema.add_object_attribute(_label, attr.to_eta_attribute())
+                seen.add(key)
+
+
+def _make_cvat_meta_element(
+    cvat_task_labels, size, mode, id=None, name=None, original_size=None
+):
+    now = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    id = str(id) if id is not None else ""
+    name = name if name is not None else ""
+
+    meta = ET.Element("meta")
+    task = ET.SubElement(meta, "task")
+    _add_text_elements(
+        task,
+        id=id,
+        name=name,
+        size=str(size),
+        mode=mode,
+        overlap="",
+        bugtracker="",
+        flipped="False",
+        created=now,
+        updated=now,
+    )
+
+    labels = ET.SubElement(task, "labels")
+    for label in cvat_task_labels.labels:
+        label_elem = ET.SubElement(labels, "label")
+        _add_text_elements(label_elem, name=label["name"])
+        attributes = ET.SubElement(label_elem, "attributes")
+        for attribute in label.get("attributes", []):
+            _add_text_elements(
+                ET.SubElement(attributes, "attribute"),
+                name=attribute["name"],
+                values="\n".join(attribute["categories"]),
+            )
+
+    segments = ET.SubElement(task, "segments")
+    _add_text_elements(
+        ET.SubElement(segments, "segment"),
+        id=id,
+        start="0",
+        stop=str(max(size - 1, 0)),
+        url="",
+    )
+
+    _add_text_elements(ET.SubElement(task, "owner"), username="", email="")
+
+    if original_size is not None:
+        width, height = original_size
+        _add_text_elements(
+            ET.SubElement(task, "original_size"),
+            width=str(width),
+            height=str(height),
+        )
+
+    _add_text_elements(meta, dumped=now)
+
+    return meta
+
+
+def _cvat_image_to_xml_str(cvat_image):
+    image = ET.Element(
+        "image",
+        id=str(cvat_image.id),
+        name=str(cvat_image.name),
+        width=str(cvat_image.width),
+        height=str(cvat_image.height),
+    )
+
+    for box in cvat_image.boxes:
+        _add_cvat_anno_element(
+            image,
+            "box",
+            box,
+            label=box.label,
+            xtl=str(box.xtl),
+            ytl=str(box.ytl),
+            xbr=str(box.xbr),
+            ybr=str(box.ybr),
+        )
+
+    for tag, annos in (
+        ("polygon", cvat_image.polygons),
+        ("polyline", cvat_image.polylines),
+        ("points", cvat_image.points),
+    ):
+        for anno in annos:
+            _add_cvat_anno_element(
+                image, tag, anno, label=anno.label, points=anno.points_str
+            )
+
+    return _to_xml_str(image, level=1)
+
+
+def _cvat_track_to_xml_str(cvat_track):
+    track = ET.Element(
+        "track", id=str(cvat_track.id), label=str(cvat_track.label)
+    )
+
+    for frame, box in sorted(cvat_track.boxes.items()):
+        _add_cvat_anno_element(
+            track,
+            "box",
+            box,
+            frame=str(frame),
+            xtl=str(box.xtl),
+            ytl=str(box.ytl),
+            xbr=str(box.xbr),
+            ybr=str(box.ybr),
+        )
+
+    for tag, annos in (
+        ("polygon", cvat_track.polygons),
+        ("polyline", cvat_track.polylines),
+        ("points", cvat_track.points),
+    ):
+        for frame, anno in sorted(annos.items()):
+            _add_cvat_anno_element(
+                track, tag, anno, frame=str(frame), points=anno.points_str
+            )
+
+    return _to_xml_str(track, level=1)
+
+
+def _add_cvat_anno_element(parent, tag, anno, **attrib):
+    for key in ("outside", "occluded", "keyframe"):
+        value = getattr(anno, key, None)
+        if value is not None:
+            attrib[key] = str(int(value))
+
+    elem = ET.SubElement(parent, tag, attrib)
+    for attr in anno.attributes:
+        ET.SubElement(elem, "attribute", name=attr.name).text = str(attr.value)
+
+    return elem
+
+
+def _add_text_elements(parent, **texts):
+    for tag, text in texts.items():
+        ET.SubElement(parent, tag).text = text
+
+
+def _write_cvat_annotations(xml_path, meta, anno_strs):
+    etau.ensure_basedir(xml_path)
+    with open(xml_path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        f.write("<annotations>\n")
+        f.write("    <version>1.1</version>\n")
+        f.write(_to_xml_str(meta, level=1))
+        for anno_str in anno_strs:
+            f.write(anno_str)
+
+        f.write("</annotations>")
+
+
+def _to_xml_str(elem, level=0):
+    _indent_xml(elem, level=level)
+    elem.tail = None
+    xml_str = ET.tostring(elem, encoding="unicode", short_empty_elements=False)
+    return "    " * level + xml_str + "\n"
+
+
+def _indent_xml(elem, level=0):
+    if not len(elem):
+        return
+
+    indent = "\n" + "    " * (level + 1)
+    elem.text = indent
+    for child in elem:
+        _indent_xml(child, level=level + 1)
+        child.tail = indent
+
+    child.tail = indent[:-4]
+
+
 def _cvat_tracks_to_frames_dict(cvat_tracks):
     frames = defaultdict(dict)
     for cvat_track in cvat_tracks:
@@ -2474,35 +2954,31 @@ def _cvat_tracks_to_frames_dict(cvat_tracks):
         for frame_number, label in labels.items():
             frame = frames[frame_number]
 
-            if isinstance(label, fol.Detection):
-                if "detections" not in frame:
-                    frame["detections"] = fol.Detections()
-
-                frame["detections"].detections.append(label)
-            elif isinstance(label, fol.Polyline):
-                if "polylines" not in frame:
-                    frame["polylines"] = fol.Polylines()
+            key = _get_by_type(_TRACK_LABEL_KEYS, label)
+            if key is None:
+                continue
 
-                frame["polylines"].polylines.append(label)
-            elif isinstance(label, fol.Keypoint):
-                if "keypoints" not in frame:
-                    frame["keypoints"] = fol.Keypoints()
+            container = frame.get(key, None)
+            if container is None:
+                container = _TRACK_LABEL_CONTAINERS[key]()
+                frame[key] = container
 
-                frame["keypoints"].keypoints.append(label)
+            # The list attribute of each container has the same name as its key
+            getattr(container, key).append(label)
 
     return frames
 
 
 def _frames_to_cvat_tracks(frames, frame_size):
-    labels_map = defaultdict(dict)
-    no_index_map = defaultdict(list)
+    indexed = []
+    no_index = []
     found_label = False
 
     def process_label(label, frame_number):
         if label.index is not None:
-            labels_map[label.index][frame_number] = label
+            indexed.append((label.index, frame_number, label))
         else:
-            no_index_map[frame_number].append(label)
+            no_index.append((frame_number, label))
 
     # Convert from per-frame to per-object tracks
     for frame_number, frame_dict in frames.items():
@@ -2531,33 +3007,158 @@ def _frames_to_cvat_tracks(frames, frame_size):
 
     cvat_tracks = []
 
-    # Generate object tracks
+    # Generate object tracks. The sort is stable, so frames remain in their
+    # original order within each track
+    indexed.sort(key=itemgetter(0))
+
     max_index = -1
-    for index in sorted(labels_map):
+    for index, group in itertools.groupby(indexed, key=itemgetter(0)):
         max_index = max(index, max_index)
-        labels = labels_map[index]
+        labels = {frame_number: label for _, frame_number, label in group}
         cvat_track = CVATTrack.from_labels(index, labels, frame_size)
         cvat_tracks.append(cvat_track)
 
     # Generate single tracks for detections with no `index`
     index = max_index
-    for frame_number, labels in no_index_map.items():
-        for label in labels:
-            index += 1
-            cvat_track = CVATTrack.from_labels(
-                index, {frame_number: label}, frame_size
-            )
-            cvat_tracks.append(cvat_track)
+    for frame_number, label in no_index:
+        index += 1
+        cvat_track = CVATTrack.from_labels(
+            index, {frame_number: label}, frame_size
+        )
+        cvat_tracks.append(cvat_track)
 
     return cvat_tracks
 
 
+def _parse_attribute_dicts(attrs):
+    if attrs is None:
+        return []
+
+    if not isinstance(attrs, list):
+        attrs = [attrs]
+
+    attributes = []
+    for attr in attrs:
+        name = attr["@name"]
+        if name.startswith("@"):
+            name = name.lstrip("@")
+
+        name = sys.intern(name)
+
+        value = _parse_attribute_value(attr["#text"])
+        attributes.append(CVATAttribute(name, value))
+
+    return attributes
+
+
+def _parse_bool_str(value):
+    if value is None:
+        return None
+
+    # CVAT writes flags as "0" or "1", which can be looked up directly
+    b = _BOOL_STRS.get(value, None)
+    if b is None:
+        b = bool(int(value))
+
+    return b
+
+
+_BOOL_STRS = {"0": False, "1": True}
+
+
+def _parse_attribute_value(value):
+    # Only attempt numeric conversion of values that could be numbers, since
+    # raising exceptions for every string-valued attribute is expensive
+    c = value[:1]
+    if c in _NUMERIC_START_CHARS or c.isspace() or c.isdigit():
+        try:
+            return float(value)
+        except ValueError:
+            pass
+
+    # Categorical values are typically repeated across many annotations
+    return sys.intern(value)
+
+
+# ASCII characters that can start a string that `float()` accepts. It also
+# accepts leading whitespace and non-ASCII digits
+_NUMERIC_START_CHARS = set("0123456789+-.iInN")
+
+
+def _get_attribute_classes(value):
+    # Attribute values are almost always of one of the builtin types in
+    # `_ATTRIBUTE_CLASSES`, so their classes can be looked up by exact type
+    classes = _ATTRIBUTE_CLASSES.get(type(value), None)
+    if classes is not None:
+        return classes
+
+    if isinstance(value, bool):
+        return etad.BooleanAttribute, fol.BooleanAttribute
+
+    if etau.is_numeric(value):
+        return etad.NumericAttribute, fol.NumericAttribute
+
+    return etad.CategoricalAttribute, fol.CategoricalAttribute
+
+
+_ATTRIBUTE_CLASSES = {
+    bool: (etad.BooleanAttribute, fol.BooleanAttribute),
+    int: (etad.NumericAttribute, fol.NumericAttribute),
+    float: (etad.NumericAttribute, fol.NumericAttribute),
+    str: (etad.CategoricalAttribute, fol.CategoricalAttribute),
+}
+
+
+def _get_attribute_specs(attributes, **flags):
+    if attributes:
+        specs = [a._to_attribute_spec() for a in attributes]
+    else:
+        specs = []
+
+    bool_attr_cls = fol.BooleanAttribute
+    for name, value in flags.items():
+        if value is not None:
+            specs.append((name, bool_attr_cls, value))
+
+    return specs
+
+
+def _make_attributes(attr_specs):
+    # Annotations cache the `(name, attr_cls, value)` specs of their attributes
+    # when they are first converted, but `fol.Attribute` instances are mutable,
+    # so new ones are created for every label
+    if not attr_specs:
+        return {}
+
+    return {
+        name: attr_cls(value=value) for name, attr_cls, value in attr_specs
+    }
+
+
+def _boxes_to_detections(boxes, frame_size):
+    # Batch version of `to_detection()` that converts the coordinates of all
+    # boxes at once
+    bboxes = np.array([(b.xtl, b.ytl, b.xbr, b.ybr) for b in boxes])
+    bboxes = bboxes.astype(float).reshape(-1, 4)
+    bboxes[:, 2:] -= bboxes[:, :2]
+    bboxes /= np.tile(np.asarray(frame_size, dtype=float), 2)
+
+    return [
+        fol.Detection(
+            label=box.label,
+            bounding_box=bounding_box,
+            attributes=box._to_attributes(),
+        )
+        for box, bounding_box in zip(boxes, bboxes.tolist())
+    ]
+
+
 def _get_single_polyline_points(polyline):
     num_polylines = len(polyline.points)
     if num_polylines == 0:
         return []
 
-    if num_polylines > 0:
+    if num_polylines > 1:
         msg = (
             "Found polyline with more than one shape; only the first shape "
             "will be stored in CVAT format"
@@ -2567,9 +3168,124 @@ def _get_single_polyline_points(polyline):
     return polyline.points[0]
 
 
+def _list_files(dir_path, abs_paths=False):
+    # Like `etau.list_files()`, but uses the file types cached by
+    # `os.scandir()` rather than issuing a `stat()` call per file
+    with os.scandir(dir_path) as it:
+        filenames = sorted(
+            e.name for e in it if not e.name.startswith(".") and e.is_file()
+        )
+
+    if abs_paths:
+        basedir = os.path.abspath(os.path.realpath(dir_path))
+        filenames = [os.path.join(basedir, f) for f in filenames]
+
+    return filenames
+
+
+def _load_cvat_video_labels(xml_path):
+    # Also converts the tracks to per-frame labels, so that this work is done
+    # by the worker processes of importers rather than the main process
+    anno = load_cvat_video_annotations(xml_path)
+    frames = _cvat_tracks_to_frames_dict(anno[2])
+    return anno, frames
+
+
+class _CVATVideoAnnotationsCache(object):
+    # A bounded LRU cache of parsed CVAT video labels files, keyed by
+    # ``(path, mtime_ns, size)`` so that entries are invalidated when a file is
+    # modified. The cached annotations are only used internally to generate
+    # new labels, so they are never exposed to callers
+    def __init__(self, size=16):
+        self.size = size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get(self, xml_path):
+        key = self._get_key(xml_path)
+        with self._lock:
+            anno = self._cache.get(key, None)
+            if anno is not None:
+                self._cache.move_to_end(key)
+
+        return anno
+
+    def put(self, xml_path, anno):
+        key = self._get_key(xml_path)
+        with self._lock:
+            self._cache[key] = anno
+            while len(self._cache) > self.size:
+                self._cache.popitem(last=False)
+
+    def load(self, xml_path):
+        anno = self.get(xml_path)
+        if anno is None:
+            anno = load_cvat_video_annotations(xml_path)
+            self.put(xml_path, anno)
+
+        return anno
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _get_key(xml_path):
+        st = os.stat(xml_path)
+        return xml_path, st.st_mtime_ns, st.st_size
+
+
+# Maps label types to (key, fcn) tuples, where `fcn` returns the list of
+# individual labels that the label contains
+_IMAGE_LABEL_HANDLERS = {
+    fol.Detection: ("detections", lambda l: [l]),
+    fol.Detections: ("detections", lambda l: l.detections),
+    fol.Polyline: ("polylines", lambda l: [l]),
+    fol.Polylines: ("polylines", lambda l: l.polylines),
+    fol.Keypoint: ("keypoints", lambda l: [l]),
+    fol.Keypoints: ("keypoints", lambda l: l.keypoints),
+}
+
+
+# Maps label types to the keys under which `CVATTrack.from_labels()` groups
+# them
+_TRACK_LABEL_KEYS = {
+    fol.Detection: "detections",
+    fol.Polyline: "polylines",
+    fol.Keypoint: "keypoints",
+}
+
+_TRACK_LABEL_CONTAINERS = {
+    "detections": fol.Detections,
+    "polylines": fol.Polylines,
+    "keypoints": fol.Keypoints,
+}
+
+
+def _get_by_type(types_map, value):
+    # A lookup by exact type is cheaper than a chain of `isinstance()` checks;
+    # subclasses fall back to a walk of their MRO
+    value_type = type(value)
+    if value_type in types_map:
+        return types_map[value_type]
+
+    for cls in value_type.__mro__[1:]:
+        if cls in types_map:
+            return types_map[cls]
+
+    return None
+
+
 def _ensure_list(value):
+    # Repeatable tags are usually already lists, so check for that first
+    if value.__class__ is list:
+        return value
+
     if value is None:
-        return []
+        return ()
 
     if isinstance(value, list):
         return value
@@ -1292,11 +1292,7 @@ class ImageClassificationDirectoryTreeImporter(LabeledImageDatasetImporter):
 
     @staticmethod
     def get_num_samples(dataset_dir):
-        num_samples = 0
-        for class_dir in etau.list_subdirs(dataset_dir, abs_paths=True):
-            num_samples += len(etau.list_files(class_dir))
-
-        return num_samples
+        return _count_files_in_subdirs(dataset_dir)
 
 
 class VideoClassificationDirectoryTreeImporter(LabeledVideoDatasetImporter):
@@ -1407,11 +1403,7 @@ class VideoClassificationDirectoryTreeImporter(LabeledVideoDatasetImporter):
 
     @staticmethod
     def get_num_samples(dataset_dir):
-        num_samples = 0
-        for class_dir in etau.list_subdirs(dataset_dir, abs_paths=True):
-            num_samples += len(etau.list_files(class_dir))
-
-        return num_samples
+        return _count_files_in_subdirs(dataset_dir)
 
 
 class FiftyOneImageDetectionDatasetImporter(LabeledImageDatasetImporter):
@@ -1811,3 +1803,21 @@ class FiftyOneVideoLabelsDatasetImporter(LabeledVideoDatasetImporter):
     @staticmethod
     def get_num_samples(dataset_dir):
         return len(etads.load_dataset(dataset_dir))
+
+
+def _count_files_in_subdirs(dataset_dir):
+    # Counts the non-hidden files in the non-hidden subdirectories of the given
+    # directory. Uses `os.scandir()`, whose entries usually know their type
+    # without an extra `stat()` call per file
+    num_samples = 0
+    with os.scandir(dataset_dir) as class_entries:
+        for class_entry in class_entries:
+            if class_entry.name.startswith(".") or not class_entry.is_dir():
+                continue
+
+            with os.scandir(class_entry.path) as entries:
+                for entry in entries:
+                    if not entry.name.startswith(".") and entry.is_file():
+                        num_samples += 1
+
+    return num_samples
@@ -5,7 +5,16 @@ Sample parsers.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from functools import partial
+import operator
+import os
+import threading
+
 import numpy as np
+import PIL.Image
 
 import eta.core.image as etai
 import eta.core.frames as etaf
@@ -19,7 +28,7 @@ import fiftyone.core.metadata as fom
 import fiftyone.core.sample as fos
 
 
-def add_images(dataset, samples, sample_parser, tags=None):
+def add_images(dataset, samples, sample_parser, tags=None, num_workers=None):
     """Adds the given images to the dataset.
 
     This operation does not read the images.
@@ -35,6 +44,11 @@ def add_images(dataset, samples, sample_parser, tags=None):
             :class:`fiftyone.utils.data.parsers.UnlabeledImageSampleParser`
             instance to use to parse the samples
         tags (None): an optional list of tags to attach to each sample
+        num_workers (None): an optional number of background threads to use
+            to parse the samples, so that parsing overlaps with database
+            inserts. If more than one thread is used, each thread uses its own
+            shallow copy of ``sample_parser``. By default, samples are parsed
+            in the calling thread
 
     Returns:
         a list of IDs of the samples that were added to the dataset
@@ -54,24 +68,17 @@ def add_images(dataset, samples, sample_parser, tags=None):
             )
         )
 
-    def parse_sample(sample):
-        sample_parser.with_sample(sample)
-
-        image_path = sample_parser.get_image_path()
+    has_metadata = sample_parser.has_image_metadata
 
-        if sample_parser.has_image_metadata:
-            metadata = sample_parser.get_image_metadata()
-        else:
-            metadata = None
+    parse_sample = partial(
+        _parse_unlabeled_image_sample, has_metadata=has_metadata, tags=tags
+    )
 
-        return fos.Sample(filepath=image_path, metadata=metadata, tags=tags)
+    num_samples = _get_num_samples(samples)
 
-    try:
-        num_samples = len(samples)
-    except:
-        num_samples = None
-
-    _samples = map(parse_sample, samples)
+    _samples = _parse_samples(
+        parse_sample, samples, sample_parser, num_workers
+    )
     return dataset.add_samples(
         _samples, num_samples=num_samples, expand_schema=False
     )
@@ -84,6 +91,7 @@ def add_labeled_images(
     label_field="ground_truth",
     tags=None,
     expand_schema=True,
+    num_workers=None,
 ):
     """Adds the given labeled images to the dataset.
 
@@ -107,6 +115,8 @@ def add_labeled_images(
         expand_schema (True): whether to dynamically add new sample fields
             encountered to the dataset schema. If False, an error is raised
             if a sample's schema is not a subset of the dataset schema
+        num_workers (None): an optional number of background threads to use
+            to parse the samples. See :func:`add_images` for details
 
     Returns:
         a list of IDs of the samples that were added to the dataset
@@ -143,43 +153,31 @@ def add_labeled_images(
         expand_schema = False
 
     if label_field:
-        label_key = lambda k: label_field + "_" + k
+        label_keys = _PrefixedKeys(label_field + "_")
     else:
-        label_key = lambda k: k
-
-    def parse_sample(sample):
-        sample_parser.with_sample(sample)
+        label_keys = None
 
-        image_path = sample_parser.get_image_path()
+    has_metadata = sample_parser.has_image_metadata
 
-        if sample_parser.has_image_metadata:
-            metadata = sample_parser.get_image_metadata()
-        else:
-            metadata = None
-
-        label = sample_parser.get_label()
-
-        sample = fos.Sample(filepath=image_path, metadata=metadata, tags=tags)
-
-        if isinstance(label, dict):
-            sample.update_fields({label_key(k): v for k, v in label.items()})
-        elif label is not None:
-            sample[label_field] = label
-
-        return sample
+    parse_sample = partial(
+        _parse_labeled_image_sample,
+        has_metadata=has_metadata,
+        label_field=label_field,
+        label_keys=label_keys,
+        tags=tags,
+    )
 
-    try:
-        num_samples = len(samples)
-    except:
-        num_samples = None
+    num_samples = _get_num_samples(samples)
 
-    _samples = map(parse_sample, samples)
+    _samples = _parse_samples(
+        parse_sample, samples, sample_parser, num_workers
+    )
     return dataset.add_samples(
         _samples, expand_schema=expand_schema, num_samples=num_samples
     )
 
 
-def add_videos(dataset, samples, sample_parser, tags=None):
+def add_videos(dataset, samples, sample_parser, tags=None, num_workers=None):
     """Adds the given videos to the dataset.
 
     This operation does not read the videos.
@@ -195,6 +193,8 @@ def add_videos(dataset, samples, sample_parser, tags=None):
             :class:`fiftyone.utils.data.parsers.UnlabeledVideoSampleParser`
             instance to use to parse the samples
         tags (None): an optional list of tags to attach to each sample
+        num_workers (None): an optional number of background threads to use
+            to parse the samples. See :func:`add_images` for details
 
     Returns:
         a list of IDs of the samples that were added to the dataset
@@ -208,28 +208,22 @@ def add_videos(dataset, samples, sample_parser, tags=None):
             )
         )
 
-    def parse_sample(sample):
-        sample_parser.with_sample(sample)
+    has_metadata = sample_parser.has_video_metadata
 
-        video_path = sample_parser.get_video_path()
-
-        if sample_parser.has_video_metadata:
-            metadata = sample_parser.get_video_metadata()
-        else:
-            metadata = None
+    parse_sample = partial(
+        _parse_unlabeled_video_sample, has_metadata=has_metadata, tags=tags
+    )
 
-        return fos.Sample(filepath=video_path, metadata=metadata, tags=tags)
+    num_samples = _get_num_samples(samples)
 
-    try:
-        num_samples = len(samples)
-    except:
-        num_samples = None
-
-    _samples = map(parse_sample, samples)
+    _samples = _parse_samples(
+        parse_sample, samples, sample_parser, num_workers
+    )
 
-    # @todo: skip schema expansion and set media type before adding samples
+    # Unlabeled video samples only have default fields, so the schema never
+    # needs expanding
     return dataset.add_samples(
-        _samples, num_samples=num_samples, expand_schema=True
+        _samples, num_samples=num_samples, expand_schema=False
     )
 
 
@@ -240,6 +234,7 @@ def add_labeled_videos(
     label_field="ground_truth",
     tags=None,
     expand_schema=True,
+    num_workers=None,
 ):
     """Adds the given labeled videos to the dataset.
 
@@ -262,6 +257,8 @@ def add_labeled_videos(
         expand_schema (True): whether to dynamically add new sample fields
             encountered to the dataset schema. If False, an error is raised
             if a sample's schema is not a subset of the dataset schema
+        num_workers (None): an optional number of background threads to use
+            to parse the samples. See :func:`add_images` for details
 
     Returns:
         a list of IDs of the samples that were added to the dataset
@@ -276,43 +273,24 @@ def add_labeled_videos(
         )
 
     if label_field:
-        label_key = lambda k: label_field + "_" + k
+        label_keys = _PrefixedKeys(label_field + "_")
     else:
-        label_key = lambda k: k
-
-    def parse_sample(sample):
-        sample_parser.with_sample(sample)
+        label_keys = None
 
-        video_path = sample_parser.get_video_path()
-
-        if sample_parser.has_video_metadata:
-            metadata = sample_parser.get_video_metadata()
-        else:
-            metadata = None
-
-        sample = fos.Sample(filepath=video_path, metadata=metadata, tags=tags)
-
-        frames = sample_parser.get_frame_labels()
-
-        if frames is not None:
-            sample.frames.merge(
-                {
-                    frame_number: {
-                        label_key(field_name): label
-                        for field_name, label in frame_dict.items()
-                    }
-                    for frame_number, frame_dict in frames.items()
-                }
-            )
+    has_metadata = sample_parser.has_video_metadata
 
-        return sample
+    parse_sample = partial(
+        _parse_labeled_video_sample,
+        has_metadata=has_metadata,
+        label_keys=label_keys,
+        tags=tags,
+    )
 
-    try:
-        num_samples = len(samples)
-    except:
-        num_samples = None
+    num_samples = _get_num_samples(samples)
 
-    _samples = map(parse_sample, samples)
+    _samples = _parse_samples(
+        parse_sample, samples, sample_parser, num_workers
+    )
     return dataset.add_samples(
         _samples, expand_schema=expand_schema, num_samples=num_samples
     )
@@ -785,7 +763,8 @@ class LabeledImageTupleSampleParser(LabeledImageSampleParser):
 
     def __init__(self):
         super().__init__()
-        self._current_image_cache = None
+        self._current_image_cache = _MISSING
+        self._current_frame_size_cache = _MISSING
 
     @property
     def has_image_path(self):
@@ -816,19 +795,43 @@ class LabeledImageTupleSampleParser(LabeledImageSampleParser):
 
     def clear_sample(self):
         super().clear_sample()
-        self._current_image_cache = None
+        self._current_image_cache = _MISSING
+        self._current_frame_size_cache = _MISSING
 
     @property
     def _current_image(self):
-        if self._current_image_cache is None:
+        # A sentinel is used so that images are loaded at most once per
+        # sample, even if `_get_image()` returns None
+        if self._current_image_cache is _MISSING:
             self._current_image_cache = self._get_image()
 
         return self._current_image_cache
 
+    @property
+    def _current_frame_size(self):
+        if self._current_frame_size_cache is _MISSING:
+            self._current_frame_size_cache = self._get_frame_size()
+
+        return self._current_frame_size_cache
+
     def _get_image(self):
         image_or_path = self.current_sample[0]
         return self._parse_image(image_or_path)
 
+    def _get_frame_size(self):
+        # If the image has not been loaded and is on disk, only its header is
+        # read, rather than decoding the whole image
+        if self._current_image_cache is _MISSING:
+            try:
+                image_or_path = self.current_sample[0]
+            except (TypeError, IndexError, KeyError):
+                image_or_path = None
+
+            if etau.is_str(image_or_path) and os.path.isfile(image_or_path):
+                return _read_frame_size(image_or_path)
+
+        return etai.to_frame_size(img=self._current_image)
+
     def _parse_image(self, image_or_path):
         if etau.is_str(image_or_path):
             return etai.read(image_or_path)
@@ -879,10 +882,14 @@ class ImageClassificationSampleParser(LabeledImageTupleSampleParser):
         if target is None:
             return None
 
-        try:
-            label = self.classes[target]
-        except:
+        if self.classes is None:
+            # Avoids raising and catching an exception for every sample
             label = str(target)
+        else:
+            try:
+                label = self.classes[target]
+            except:
+                label = str(target)
 
         return fol.Classification(label=label)
 
@@ -976,42 +983,51 @@ class ImageDetectionSampleParser(LabeledImageTupleSampleParser):
 
         if not self.normalized:
             # Absolute bounding box coordinates were provided, so we must have
-            # the image to convert to relative coordinates
-            img = self._current_image
+            # the image dimensions to convert to relative coordinates
+            frame_size = self._current_frame_size
         else:
-            img = None
+            frame_size = None
 
-        return self._parse_label(target, img=img)
+        return self._parse_label(target, frame_size=frame_size)
 
-    def _parse_label(self, target, img=None):
+    def _parse_label(self, target, img=None, frame_size=None):
         if target is None:
             return None
 
         if etau.is_str(target):
             target = etas.load_json(target)
 
+        bboxes = [self._parse_bbox(obj) for obj in target]
+
+        if not self.normalized and bboxes:
+            # Convert all boxes to relative coordinates in one operation
+            width, height = etai.to_frame_size(frame_size=frame_size, img=img)
+            scale = (width, height, width, height)
+            bboxes = (np.asarray(bboxes, dtype=float) / scale).tolist()
+
         return fol.Detections(
-            detections=[self._parse_detection(obj, img=img) for obj in target]
+            detections=[
+                self._parse_detection(obj, bounding_box=bbox)
+                for obj, bbox in zip(target, bboxes)
+            ]
         )
 
-    def _parse_detection(self, obj, img=None):
-        label = obj[self.label_field]
-
-        try:
-            label = self.classes[label]
-        except:
-            label = str(label)
+    def _parse_detection(self, obj, bounding_box=None):
+        target = obj[self.label_field]
 
-        tlx, tly, w, h = self._parse_bbox(obj)
+        if self.classes is None:
+            # Avoids raising and catching an exception for every object
+            label = str(target)
+        else:
+            try:
+                label = self.classes[target]
+            except:
+                label = str(target)
 
-        if not self.normalized:
-            height, width = img.shape[:2]
-            tlx /= width
-            tly /= height
-            w /= width
-            h /= height
+        if bounding_box is None:
+            bounding_box = self._parse_bbox(obj)
 
-        bounding_box = [tlx, tly, w, h]
+        bounding_box = list(bounding_box)
 
         if self.confidence_field:
             confidence = obj.get(self.confidence_field, None)
@@ -1039,6 +1055,16 @@ class ImageDetectionSampleParser(LabeledImageTupleSampleParser):
         return obj[self.bounding_box_field]
 
     def _parse_attribute(self, value):
+        value_type = type(value)
+
+        attr_cls = _ATTRIBUTE_CLASSES.get(value_type, None)
+        if attr_cls is not None:
+            return attr_cls(value=value)
+
+        if value_type in _NUMPY_NUMERIC_TYPES:
+            # Store numpy scalars as their builtin equivalents
+            return fol.NumericAttribute(value=value.item())
+
         if etau.is_str(value):
             return fol.CategoricalAttribute(value=value)
 
@@ -1321,6 +1347,11 @@ class FiftyOneLabeledImageSampleParser(LabeledImageSampleParser):
         self.label_field_or_dict = label_field_or_dict
         self.compute_metadata = compute_metadata
 
+        if isinstance(label_field_or_dict, dict):
+            self._get_labels = _make_labels_getter(label_field_or_dict)
+        else:
+            self._get_labels = None
+
     @property
     def has_image_path(self):
         return True
@@ -1349,11 +1380,8 @@ class FiftyOneLabeledImageSampleParser(LabeledImageSampleParser):
         return metadata
 
     def get_label(self):
-        if isinstance(self.label_field_or_dict, dict):
-            return {
-                v: self.current_sample[k]
-                for k, v in self.label_field_or_dict.items()
-            }
+        if self._get_labels is not None:
+            return self._get_labels(self.current_sample)
 
         return self.current_sample[self.label_field_or_dict]
 
@@ -1372,6 +1400,7 @@ class FiftyOneUnlabeledVideoSampleParser(UnlabeledVideoSampleParser):
     def __init__(self, compute_metadata=False):
         super().__init__()
         self.compute_metadata = compute_metadata
+        self._metadata_cache = {}
 
     @property
     def has_video_metadata(self):
@@ -1383,8 +1412,8 @@ class FiftyOneUnlabeledVideoSampleParser(UnlabeledVideoSampleParser):
     def get_video_metadata(self):
         metadata = self.current_sample.metadata
         if metadata is None and self.compute_metadata:
-            metadata = fom.VideoMetadata.build_for(
-                self.current_sample.filepath
+            metadata = _build_video_metadata(
+                self.current_sample.filepath, self._metadata_cache
             )
 
         return metadata
@@ -1420,6 +1449,19 @@ class FiftyOneLabeledVideoSampleParser(LabeledVideoSampleParser):
             frame_labels_field_or_dict
         )
         self.compute_metadata = compute_metadata
+        self._metadata_cache = {}
+
+        if isinstance(label_field_or_dict, dict):
+            self._get_labels = _make_labels_getter(label_field_or_dict)
+        else:
+            self._get_labels = None
+
+        if self.frame_labels_dict is not None:
+            self._get_frame_labels = _make_labels_getter(
+                self.frame_labels_dict
+            )
+        else:
+            self._get_frame_labels = None
 
     @property
     def has_video_metadata(self):
@@ -1439,8 +1481,8 @@ class FiftyOneLabeledVideoSampleParser(LabeledVideoSampleParser):
     def get_video_metadata(self):
         metadata = self.current_sample.metadata
         if metadata is None and self.compute_metadata:
-            metadata = fom.VideoMetadata.build_for(
-                self.current_sample.filepath
+            metadata = _build_video_metadata(
+                self.current_sample.filepath, self._metadata_cache
             )
 
         return metadata
@@ -1449,26 +1491,21 @@ class FiftyOneLabeledVideoSampleParser(LabeledVideoSampleParser):
         if self.label_field_or_dict is None:
             return None
 
-        if isinstance(self.label_field_or_dict, dict):
-            return {
-                v: self.current_sample[k]
-                for k, v in self.label_field_or_dict.items()
-            }
+        if self._get_labels is not None:
+            return self._get_labels(self.current_sample)
 
         return self.current_sample[self.label_field_or_dict]
 
     def get_frame_labels(self):
-        if self.frame_labels_dict is None:
+        if self._get_frame_labels is None:
             return None
 
+        get_frame_labels = self._get_frame_labels
         frames = self.current_sample.frames
-        new_frames = {}
-        for frame_number, frame in frames.items():
-            new_frames[frame_number] = {
-                v: frame[k] for k, v in self.frame_labels_dict.items()
-            }
-
-        return new_frames
+        return {
+            frame_number: get_frame_labels(frame)
+            for frame_number, frame in frames.items()
+        }
 
     @staticmethod
     def _parse_labels_dict(labels_field_or_dict):
@@ -1479,3 +1516,236 @@ class FiftyOneLabeledVideoSampleParser(LabeledVideoSampleParser):
             return {labels_field_or_dict: labels_field_or_dict}
 
         return labels_field_or_dict
+
+
+def _make_labels_getter(labels_dict):
+    # Returns a function that reads the keys of ``labels_dict`` from an object
+    # via a single ``itemgetter`` call and returns a dict keyed by the values
+    in_keys = tuple(labels_dict.keys())
+    out_keys = tuple(labels_dict.values())
+
+    if not in_keys:
+        return lambda obj: {}
+
+    if len(in_keys) == 1:
+        # `itemgetter` returns a bare value rather than a tuple for one key
+        in_key, out_key = in_keys[0], out_keys[0]
+        return lambda obj: {out_key: obj[in_key]}
+
+    getter = operator.itemgetter(*in_keys)
+    return lambda obj: dict(zip(out_keys, getter(obj)))
+
+
+def _build_video_metadata(video_path, cache):
+    # Videos that appear in multiple samples are only probed once per parser,
+    # as long as their modification time and size have not changed
+    st = os.stat(video_path)
+    version = (st.st_mtime_ns, st.st_size)
+
+    entry = cache.get(video_path, None)
+    if entry is None or entry[0] != version:
+        entry = (version, fom.VideoMetadata.build_for(video_path))
+        cache[video_path] = entry
+
+    return entry[1].copy()
+
+
+def _get_num_samples(samples):
+    # Uses `len()` when available, and otherwise any length hint that the
+    # iterable provides, without raising for unsized iterables
+    num_samples = operator.length_hint(samples, -1)
+    return num_samples if num_samples >= 0 else None
+
+
+def _parse_unlabeled_image_sample(sample_parser, sample, has_metadata, tags):
+    sample_parser.with_sample(sample)
+
+    image_path = sample_parser.get_image_path()
+
+    if has_metadata:
+        metadata = sample_parser.get_image_metadata()
+    else:
+        metadata = None
+
+    return fos.Sample(filepath=image_path, metadata=metadata, tags=tags)
+
+
+def _parse_labeled_image_sample(
+    sample_parser, sample, has_metadata, label_field, label_keys, tags
+):
+    sample_parser.with_sample(sample)
+
+    image_path = sample_parser.get_image_path()
+
+    if has_metadata:
+        metadata = sample_parser.get_image_metadata()
+    else:
+        metadata = None
+
+    label = sample_parser.get_label()
+
+    sample = fos.Sample(filepath=image_path, metadata=metadata, tags=tags)
+
+    if isinstance(label, dict):
+        if label_keys is not None:
+            label = {label_keys[k]: v for k, v in label.items()}
+
+        sample.update_fields(label)
+    elif label is not None:
+        sample[label_field] = label
+
+    return sample
+
+
+def _parse_unlabeled_video_sample(sample_parser, sample, has_metadata, tags):
+    sample_parser.with_sample(sample)
+
+    video_path = sample_parser.get_video_path()
+
+    if has_metadata:
+        metadata = sample_parser.get_video_metadata()
+    else:
+        metadata = None
+
+    return fos.Sample(filepath=video_path, metadata=metadata, tags=tags)
+
+
+def _parse_labeled_video_sample(
+    sample_parser, sample, has_metadata, label_keys, tags
+):
+    sample_parser.with_sample(sample)
+
+    video_path = sample_parser.get_video_path()
+
+    if has_metadata:
+        metadata = sample_parser.get_video_metadata()
+    else:
+        metadata = None
+
+    sample = fos.Sample(filepath=video_path, metadata=metadata, tags=tags)
+
+    frames = sample_parser.get_frame_labels()
+
+    if frames is not None:
+        # Frames only need rewriting if their fields are being renamed
+        if label_keys is not None:
+            frames = {
+                frame_number: {
+                    label_keys[field_name]: label
+                    for field_name, label in frame_dict.items()
+                }
+                for frame_number, frame_dict in frames.items()
+            }
+
+        sample.frames.merge(frames)
+
+    return sample
+
+
+def _parse_samples(parse_sample, samples, sample_parser, num_workers):
+    if num_workers is None or num_workers <= 0:
+        return (parse_sample(sample_parser, sample) for sample in samples)
+
+    return _parse_samples_threaded(
+        parse_sample, samples, sample_parser, num_workers
+    )
+
+
+def _parse_samples_threaded(parse_sample, samples, sample_parser, num_workers):
+    if num_workers == 1:
+        # A single worker can safely use the provided parser
+        _parse_sample = lambda sample: parse_sample(sample_parser, sample)
+    else:
+        # Sample parsers store the current sample, so each thread needs its
+        # own copy
+        local = threading.local()
+
+        def _parse_sample(sample):
+            _sample_parser = getattr(local, "sample_parser", None)
+            if _sample_parser is None:
+                _sample_parser = copy(sample_parser)
+                local.sample_parser = _sample_parser
+
+            return parse_sample(_sample_parser, sample)
+
+    # Only a bounded window of samples is submitted at a time, so that
+    # `samples` is consumed lazily and the parsed samples are emitted in order.
+    # The window spans a couple of database insert batches, so parsing can
+    # continue while a batch is being inserted
+    max_pending = max(2 * num_workers, _PREFETCH_SIZE)
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        pending = deque()
+        try:
+            for sample in samples:
+                pending.append(executor.submit(_parse_sample, sample))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # If the caller stops early (e.g., an insert failed), don't wait
+            # for the remaining samples to be parsed
+            for future in pending:
+                future.cancel()
+
+
+# The number of parsed samples to prefetch when adding samples to a dataset
+_PREFETCH_SIZE = 256
+
+
+def _read_frame_size(image_path):
+    with PIL.Image.open(image_path) as img:
+        width, height = img.size
+
+        # Images are decoded via OpenCV, which applies any EXIF orientation, so
+        # transposed orientations swap the dimensions of the decoded image
+        if img.getexif().get(_EXIF_ORIENTATION_TAG, 1) in (5, 6, 7, 8):
+            width, height = height, width
+
+    return width, height
+
+
+_EXIF_ORIENTATION_TAG = 0x0112
+
+
+class _PrefixedKeys(dict):
+    # Maps label keys to their prefixed field names, computing each name only
+    # the first time that it is requested
+    def __init__(self, prefix):
+        super().__init__()
+        self.prefix = prefix
+
+    def __missing__(self, key):
+        value = self.prefix + key
+        self[key] = value
+        return value
+
+
+# Marks cached values that have not yet been computed
+_MISSING = object()
+
+
+# Attribute classes for common value types. Exact types are used as keys, so
+# ``bool`` values are not mistaken for ``int`` values
+_ATTRIBUTE_CLASSES = {
+    str: fol.CategoricalAttribute,
+    bool: fol.BooleanAttribute,
+    int: fol.NumericAttribute,
+    float: fol.NumericAttribute,
+}
+
+# Numpy scalar types that are parsed as numeric attributes
+_NUMPY_NUMERIC_TYPES = {
+    np.int8,
+    np.int16,
+    np.int32,
+    np.int64,
+    np.uint8,
+    np.uint16,
+    np.uint32,
+    np.uint64,
+    np.float16,
+    np.float32,
+    np.float64,
+}
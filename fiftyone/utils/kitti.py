@@ -51,11 +51,11 @@ class KITTIDetectionSampleParser(foud.ImageDetectionSampleParser):
             normalized=False,  # image required to convert to relative coords
         )
 
-    def _parse_label(self, target, img=None):
+    def _parse_label(self, target, img=None, frame_size=None):
         if target is None:
             return None
 
-        frame_size = etai.to_frame_size(img=img)
+        frame_size = etai.to_frame_size(frame_size=frame_size, img=img)
         return load_kitti_detection_annotations(target, frame_size)
 
 
@@ -6,6 +6,7 @@ Utilities for working with datasets in
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from functools import lru_cache
 import logging
 import os
 
@@ -78,7 +79,7 @@ class VOCDetectionSampleParser(foud.ImageDetectionSampleParser):
             normalized=True,  # True b/c image is not required to parse label
         )
 
-    def _parse_label(self, target, img=None):
+    def _parse_label(self, target, img=None, frame_size=None):
         if target is None:
             return None
 
@@ -618,12 +619,7 @@ class VOCAnnotationWriter(object):
     """
 
     def __init__(self):
-        environment = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(foc.RESOURCES_DIR),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        self.template = environment.get_template("voc_annotation_template.xml")
+        self.template = _get_template("voc_annotation_template.xml")
 
     def write(self, annotation, xml_path):
         """Writes the annotations to disk.
@@ -692,6 +688,17 @@ VOC_DETECTION_CLASSES = [
 ]
 
 
+@lru_cache(maxsize=None)
+def _get_template(name):
+    # Templates are compiled once and shared by all writers
+    environment = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(foc.RESOURCES_DIR),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+    return environment.get_template(name)
+
+
 def _ensure_list(value):
     if value is None:
         return []
@@ -47,7 +47,7 @@ class YOLOSampleParser(foud.ImageDetectionSampleParser):
             normalized=True,
         )
 
-    def _parse_label(self, target, img=None):
+    def _parse_label(self, target, img=None, frame_size=None):
         if target is None:
             return None
 
@@ -5,24 +5,32 @@ FiftyOne Zoo Datasets provided natively by the library.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import multiprocessing
 import os
 import shutil
+import tarfile
+import threading
+import zipfile
 
+import eta.core.serial as etas
 import eta.core.utils as etau
 import eta.core.web as etaw
 
+import fiftyone.core.utils as fou
 import fiftyone.types as fot
-import fiftyone.utils.bdd as foub
-import fiftyone.utils.coco as fouc
-import fiftyone.utils.cityscapes as foucs
 import fiftyone.utils.data as foud
-import fiftyone.utils.hmdb51 as fouh
-import fiftyone.utils.kitti as fouk
-import fiftyone.utils.lfw as foul
-import fiftyone.utils.ucf101 as fouu
 import fiftyone.zoo.datasets as fozd
 
+foub = fou.lazy_import("fiftyone.utils.bdd")
+fouc = fou.lazy_import("fiftyone.utils.coco")
+foucs = fou.lazy_import("fiftyone.utils.cityscapes")
+fouh = fou.lazy_import("fiftyone.utils.hmdb51")
+fouk = fou.lazy_import("fiftyone.utils.kitti")
+foul = fou.lazy_import("fiftyone.utils.lfw")
+fouu = fou.lazy_import("fiftyone.utils.ucf101")
+
 
 logger = logging.getLogger(__name__)
 
@@ -246,6 +254,12 @@ class Caltech256Dataset(FiftyOneDataset):
     _ARCHIVE_NAME = "256_ObjectCategories.tar"
     _DIR_IN_ARCHIVE = "256_ObjectCategories"
 
+    # There are two extraneous items in the raw download...
+    _EXCLUDED_PATHS = (
+        "256_ObjectCategories/056.dog/greg",
+        "256_ObjectCategories/198.spider/RENAME2",
+    )
+
     @property
     def name(self):
         return "caltech256"
@@ -265,32 +279,31 @@ class Caltech256Dataset(FiftyOneDataset):
             self._DIR_IN_ARCHIVE,
             dataset_dir,
             scratch_dir,
+            exclude=self._EXCLUDED_PATHS,
         )
 
-        # There are two extraneous items in the raw download...
-        try:
-            etau.delete_dir(os.path.join(dataset_dir, "056.dog", "greg"))
-        except:
-            pass
-
-        try:
-            etau.delete_file(
-                os.path.join(dataset_dir, "198.spider", "RENAME2")
-            )
-        except:
-            pass
-
         # Must always delete `scratch_dir` because it would be confused as a
         # class folder
         etau.delete_dir(scratch_dir)
 
         # Normalize labels
         logger.info("Normalizing labels")
+        labels_map = {}
         for old_label in etau.list_subdirs(dataset_dir):
             new_label = old_label.split(".", 1)[1]
             if new_label.endswith("-101"):
                 new_label = new_label[:-4]
 
+            labels_map[old_label] = new_label
+
+        # `etau.move_dir()` replaces existing directories, so any collisions
+        # would silently discard images
+        if len(set(labels_map.values())) != len(labels_map):
+            raise ValueError(
+                "Found multiple classes with the same normalized label"
+            )
+
+        for old_label, new_label in labels_map.items():
             etau.move_dir(
                 os.path.join(dataset_dir, old_label),
                 os.path.join(dataset_dir, new_label),
@@ -479,10 +492,7 @@ class COCO2014Dataset(FiftyOneDataset):
 
         logger.info("Parsing dataset metadata")
         dataset_type = fot.COCODetectionDataset()
-        _, classes, _, images, _ = fouc.load_coco_detection_annotations(
-            labels_path
-        )
-        num_samples = len(images)
+        classes, num_samples = _parse_coco_metadata(labels_path)
         logger.info("Found %d samples", num_samples)
 
         return dataset_type, num_samples, classes
@@ -546,10 +556,7 @@ class COCO2017Dataset(FiftyOneDataset):
 
         logger.info("Parsing dataset metadata")
         dataset_type = fot.COCODetectionDataset()
-        _, classes, _, images, _ = fouc.load_coco_detection_annotations(
-            labels_path
-        )
-        num_samples = len(images)
+        classes, num_samples = _parse_coco_metadata(labels_path)
         logger.info("Found %d samples", num_samples)
 
         return dataset_type, num_samples, classes
@@ -1059,8 +1066,24 @@ AVAILABLE_DATASETS = {
 }
 
 
+def _parse_coco_metadata(labels_path):
+    # Only the classes and number of images are needed, so the annotations,
+    # which make up the bulk of the file, are not parsed into objects
+    d = etas.load_json(labels_path)
+
+    categories = d.get("categories", None)
+    if categories is not None:
+        classes, _ = fouc.parse_coco_categories(categories)
+    else:
+        classes = None
+
+    num_samples = len({i["id"] for i in d.get("images", [])})
+
+    return classes, num_samples
+
+
 def _download_and_extract_archive(
-    fid, archive_name, dir_in_archive, dataset_dir, scratch_dir
+    fid, archive_name, dir_in_archive, dataset_dir, scratch_dir, exclude=None
 ):
     archive_path = os.path.join(scratch_dir, archive_name)
     if not os.path.exists(archive_path):
@@ -1070,10 +1093,89 @@ def _download_and_extract_archive(
         logger.info("Using existing archive '%s'", archive_path)
 
     logger.info("Extracting dataset...")
-    etau.extract_archive(archive_path)
+    if archive_path.endswith(".zip"):
+        _extract_zip(archive_path, scratch_dir, exclude=exclude)
+    elif exclude:
+        _extract_tar(archive_path, scratch_dir, exclude)
+    else:
+        etau.extract_archive(archive_path)
+
     _move_dir(os.path.join(scratch_dir, dir_in_archive), dataset_dir)
 
 
 def _move_dir(src, dst):
     for f in os.listdir(src):
         shutil.move(os.path.join(src, f), dst)
+
+
+def _extract_tar(tar_path, outdir, exclude):
+    with tarfile.open(tar_path, "r:*") as tf:
+        members = (m for m in tf if not _is_excluded(m.name, exclude))
+        tf.extractall(path=outdir, members=members)
+
+
+def _extract_zip(zip_path, outdir, exclude=None, num_workers=None):
+    # Zip members are compressed independently, so they can be inflated and
+    # written in parallel. Each worker needs its own `ZipFile` handle
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    with zipfile.ZipFile(zip_path, "r", allowZip64=True) as zf:
+        members = zf.infolist()
+        if exclude:
+            members = [
+                m for m in members if not _is_excluded(m.filename, exclude)
+            ]
+
+        # Create all directories up front so that workers never race to create
+        # the same parent directory. The directories are extracted as
+        # directory members so that `ZipFile` sanitizes their paths
+        dirs = set()
+        for member in members:
+            if member.is_dir():
+                zf.extract(member, outdir)
+            else:
+                _dir = os.path.dirname(member.filename)
+                if _dir:
+                    dirs.add(_dir)
+
+        for _dir in dirs:
+            zf.extract(zipfile.ZipInfo(_dir + "/"), outdir)
+
+    files = [m for m in members if not m.is_dir()]
+    if num_workers <= 1 or len(files) <= 1:
+        with zipfile.ZipFile(zip_path, "r", allowZip64=True) as zf:
+            for member in files:
+                zf.extract(member, outdir)
+
+        return
+
+    local = threading.local()
+    handles = []
+    lock = threading.Lock()
+
+    def _extract_member(member):
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            zf = zipfile.ZipFile(zip_path, "r", allowZip64=True)
+            local.zf = zf
+            with lock:
+                handles.append(zf)
+
+        zf.extract(member, outdir)
+
+    try:
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            # Consume the results so that any errors are raised
+            for _ in executor.map(_extract_member, files):
+                pass
+    finally:
+        for zf in handles:
+            zf.close()
+
+
+def _is_excluded(name, exclude):
+    # Whether the archive member is one of, or lies within one of, the given
+    # archive paths
+    name = name.rstrip("/")
+    return any(name == e or name.startswith(e + "/") for e in exclude)
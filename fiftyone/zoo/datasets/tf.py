@@ -8,10 +8,11 @@ FiftyOne Zoo Datasets provided by ``tensorflow_datasets``.
 import fiftyone.core.labels as fol
 import fiftyone.core.utils as fou
 import fiftyone.types as fot
-import fiftyone.utils.imagenet as foui
 import fiftyone.utils.data as foud
 import fiftyone.zoo.datasets as fozd
 
+foui = fou.lazy_import("fiftyone.utils.imagenet")
+
 
 _TFDS_IMPORT_ERROR = """
 
@@ -702,7 +703,7 @@ class _TFDSImageDetectionSampleParser(foud.ImageDetectionSampleParser):
 
         return self._parse_label(target, img=img)
 
-    def _parse_label(self, target, img=None):
+    def _parse_label(self, target, img=None, frame_size=None):
         if target is None:
             return None
 
@@ -714,7 +715,7 @@ class _TFDSImageDetectionSampleParser(foud.ImageDetectionSampleParser):
             )
         ]
 
-        return super()._parse_label(target, img=img)
+        return super()._parse_label(target, img=img, frame_size=frame_size)
 
     def _parse_bbox(self, obj):
         # Format reference:
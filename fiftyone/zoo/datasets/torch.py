@@ -8,12 +8,13 @@ FiftyOne Zoo Datasets provided by ``torchvision.datasets``.
 import fiftyone.core.labels as fol
 import fiftyone.core.utils as fou
 import fiftyone.types as fot
-import fiftyone.utils.coco as fouc
 import fiftyone.utils.data as foud
-import fiftyone.utils.imagenet as foui
-import fiftyone.utils.voc as fouv
 import fiftyone.zoo.datasets as fozd
 
+fouc = fou.lazy_import("fiftyone.utils.coco")
+foui = fou.lazy_import("fiftyone.utils.imagenet")
+fouv = fou.lazy_import("fiftyone.utils.voc")
+
 
 _TORCH_IMPORT_ERROR = """
 
@@ -0,0 +1,707 @@
+"""
+FiftyOne CVAT unit tests.
+
+| Copyright 2017-2021, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import math
+import os
+import tempfile
+import unittest
+import warnings
+
+import numpy as np
+
+import eta.core.image as etai
+
+import fiftyone as fo
+import fiftyone.utils.cvat as fouc
+
+
+class CVATTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp_dir.name
+        self.export_dir = os.path.join(self.tmp_dir, "export")
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _assert_points(self, actual, expected):
+        np.testing.assert_allclose(actual, expected)
+
+    def _assert_attributes(self, label, expected):
+        actual = {name: attr.value for name, attr in label.attributes.items()}
+        self.assertDictEqual(actual, expected)
+
+
+class CVATAnnotationTests(unittest.TestCase):
+    def _make_annos(self):
+        return [
+            fouc.CVATImageBox("cat", 0, 0, 10, 10),
+            fouc.CVATImagePolygon("road", [(0, 0), (10, 0), (10, 10)]),
+            fouc.CVATImagePolyline("lane", [(0, 0), (10, 10)]),
+            fouc.CVATImagePoints("joints", [(0, 0), (10, 10)]),
+            fouc.CVATVideoBox(0, "car", 0, 0, 10, 10),
+            fouc.CVATVideoPolygon(0, "road", [(0, 0), (10, 0), (10, 10)]),
+            fouc.CVATVideoPolyline(0, "lane", [(0, 0), (10, 10)]),
+            fouc.CVATVideoPoints(0, "joints", [(0, 0), (10, 10)]),
+            fouc.CVATAttribute("color", "black"),
+        ]
+
+    def test_custom_attributes(self):
+        # Annotations are plain objects that accept arbitrary attributes
+        for anno in self._make_annos():
+            with self.subTest(cls=anno.__class__.__name__):
+                anno.source = "model"
+                self.assertEqual(anno.source, "model")
+                self.assertIn("source", vars(anno))
+
+    def test_points_str(self):
+        polygon = fouc.CVATImagePolygon(
+            "road", [[0, 0], (10, 20), [1000000, 2000000]]
+        )
+        self.assertEqual(polygon.points_str, "0,0;10,20;1000000,2000000")
+
+        points = fouc.HasCVATPoints._parse_cvat_points_str(polygon.points_str)
+        self.assertListEqual(points, [(0, 0), (10, 20), (1000000, 2000000)])
+
+    def test_parse_attribute_value(self):
+        # Must match `float()` wherever it succeeds
+        for value in (
+            "5",
+            "-2",
+            "+.5",
+            "1e3",
+            " 7 ",
+            "\t8",
+            "inf",
+            "-Infinity",
+            "\u0663",
+        ):
+            with self.subTest(value=value):
+                parsed = fouc._parse_attribute_value(value)
+                self.assertIsInstance(parsed, float)
+                self.assertEqual(parsed, float(value))
+
+        self.assertTrue(math.isnan(fouc._parse_attribute_value("nan")))
+
+        for value in ("", "north", "Nope", "infinite", "5 apples", "-", "."):
+            with self.subTest(value=value):
+                self.assertEqual(fouc._parse_attribute_value(value), value)
+
+    def test_parse_points_str(self):
+        parse = fouc.HasCVATPoints._parse_cvat_points_str
+
+        self.assertListEqual(parse("1,2"), [(1, 2)])
+        self.assertListEqual(
+            parse("0.5,1.5;2.4, 3.6;1e3,-1"), [(0, 2), (2, 4), (1000, -1)]
+        )
+
+        for points_str in ("", "1,2;3", "1,2;", "1,2;a,b", "1;2", "1,2,3,4"):
+            with self.subTest(points_str=points_str):
+                with self.assertRaises(ValueError):
+                    parse(points_str)
+
+    def test_subclass(self):
+        class CVATImageBoxWithScore(fouc.CVATImageBox):
+            def __init__(self, *args, score=None, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.score = score
+
+        box = CVATImageBoxWithScore("cat", 0, 0, 10, 10, score=0.9)
+        self.assertEqual(box.score, 0.9)
+        self.assertEqual(box.label, "cat")
+
+
+class CVATImageTests(CVATTests):
+    def setUp(self):
+        super().setUp()
+        self.image_path = os.path.join(self.tmp_dir, "image.png")
+        etai.write(np.zeros((50, 100, 3), dtype=np.uint8), self.image_path)
+        self.metadata = fo.ImageMetadata(width=100, height=50)
+
+    def _export_and_import(self, labels, skip_unlabeled=False):
+        exporter = fouc.CVATImageDatasetExporter(self.export_dir)
+        with exporter:
+            exporter.export_sample(
+                self.image_path, labels, metadata=self.metadata
+            )
+
+        importer = fouc.CVATImageDatasetImporter(
+            self.export_dir, skip_unlabeled=skip_unlabeled
+        )
+        with importer:
+            samples = list(importer)
+
+        self.assertEqual(len(samples), 1)
+        return samples[0]
+
+    def test_roundtrip(self):
+        labels = {
+            "detections": fo.Detections(
+                detections=[
+                    fo.Detection(
+                        label="cat",
+                        bounding_box=[0.1, 0.2, 0.3, 0.4],
+                        attributes={
+                            "occluded": fo.BooleanAttribute(value=True),
+                            "color": fo.CategoricalAttribute(value="black"),
+                            "age": fo.NumericAttribute(value=3),
+                        },
+                    ),
+                    fo.Detection(
+                        label="dog",
+                        bounding_box=[0.5, 0.5, 0.5, 0.5],
+                        attributes={
+                            "occluded": fo.BooleanAttribute(value=False)
+                        },
+                    ),
+                ]
+            ),
+            "polylines": fo.Polylines(
+                polylines=[
+                    fo.Polyline(
+                        label="road",
+                        points=[[(0.1, 0.2), (0.5, 0.2), (0.5, 0.6)]],
+                        closed=True,
+                        filled=True,
+                    ),
+                    fo.Polyline(
+                        label="lane",
+                        points=[[(0.0, 0.0), (1.0, 1.0)]],
+                        closed=False,
+                        filled=False,
+                    ),
+                ]
+            ),
+            "keypoints": fo.Keypoints(
+                keypoints=[
+                    fo.Keypoint(
+                        label="joints",
+                        points=[(0.2, 0.4), (0.6, 0.8)],
+                        attributes={
+                            "visible": fo.CategoricalAttribute(value="yes")
+                        },
+                    )
+                ]
+            ),
+        }
+
+        image_path, metadata, labels = self._export_and_import(labels)
+
+        self.assertEqual(os.path.basename(image_path), "image.png")
+        self.assertEqual(metadata.width, 100)
+        self.assertEqual(metadata.height, 50)
+
+        cat, dog = labels["detections"].detections
+        self.assertEqual(cat.label, "cat")
+        self._assert_points(cat.bounding_box, [0.1, 0.2, 0.3, 0.4])
+        self._assert_attributes(
+            cat, {"occluded": True, "color": "black", "age": 3}
+        )
+        self.assertEqual(dog.label, "dog")
+        self._assert_points(dog.bounding_box, [0.5, 0.5, 0.5, 0.5])
+        self._assert_attributes(dog, {"occluded": False})
+
+        road, lane = labels["polylines"].polylines
+        self.assertEqual(road.label, "road")
+        self.assertTrue(road.closed)
+        self.assertTrue(road.filled)
+        self._assert_points(
+            road.points, [[(0.1, 0.2), (0.5, 0.2), (0.5, 0.6)]]
+        )
+        self.assertEqual(lane.label, "lane")
+        self.assertFalse(lane.closed)
+        self.assertFalse(lane.filled)
+        self._assert_points(lane.points, [[(0.0, 0.0), (1.0, 1.0)]])
+
+        (joints,) = labels["keypoints"].keypoints
+        self.assertEqual(joints.label, "joints")
+        self._assert_points(joints.points, [(0.2, 0.4), (0.6, 0.8)])
+        self._assert_attributes(joints, {"visible": "yes"})
+
+    def test_integer_boxes(self):
+        labels = {
+            "detections": fo.Detections(
+                detections=[
+                    fo.Detection(label="cat", bounding_box=[0, 0, 1, 1])
+                ]
+            )
+        }
+
+        _, _, labels = self._export_and_import(labels)
+
+        (cat,) = labels["detections"].detections
+        self._assert_points(cat.bounding_box, [0.0, 0.0, 1.0, 1.0])
+
+    def test_unlabeled(self):
+        image_path, metadata, labels = self._export_and_import(None)
+
+        self.assertEqual(os.path.basename(image_path), "image.png")
+        self.assertIsNone(labels)
+
+    def test_empty_labels(self):
+        labels = {
+            "detections": fo.Detections(),
+            "polylines": fo.Polylines(),
+        }
+
+        # Annotated images without objects are still labeled
+        image_path, metadata, labels = self._export_and_import(
+            labels, skip_unlabeled=True
+        )
+
+        self.assertEqual(os.path.basename(image_path), "image.png")
+        self.assertEqual(metadata.width, 100)
+        self.assertEqual(metadata.height, 50)
+        self.assertDictEqual(labels, {})
+
+        labels_path = os.path.join(self.export_dir, "labels.xml")
+        _, _, cvat_images = fouc.load_cvat_image_annotations(labels_path)
+        self.assertEqual(len(cvat_images), 1)
+
+    def test_mixed_empty_labels(self):
+        labels = {
+            "detections": fo.Detections(),
+            "polylines": fo.Polylines(
+                polylines=[
+                    fo.Polyline(
+                        label="lane", points=[[(0.0, 0.0), (1.0, 1.0)]]
+                    )
+                ]
+            ),
+            "keypoints": None,
+        }
+
+        _, _, labels = self._export_and_import(labels)
+
+        self.assertSetEqual(set(labels.keys()), {"polylines"})
+        (lane,) = labels["polylines"].polylines
+        self.assertEqual(lane.label, "lane")
+
+    def test_attribute_values(self):
+        attributes = {
+            "count": fo.CategoricalAttribute(value="5"),
+            "offset": fo.CategoricalAttribute(value="-1.5"),
+            "color": fo.CategoricalAttribute(value="black"),
+            "direction": fo.CategoricalAttribute(value="north"),
+            "weight": fo.NumericAttribute(value=2.5),
+        }
+        labels = {
+            "detections": fo.Detections(
+                detections=[
+                    fo.Detection(
+                        label="cat",
+                        bounding_box=[0.1, 0.1, 0.2, 0.2],
+                        attributes=dict(attributes),
+                    ),
+                    fo.Detection(
+                        label="cat",
+                        bounding_box=[0.5, 0.5, 0.2, 0.2],
+                        attributes=dict(attributes),
+                    ),
+                ]
+            )
+        }
+
+        _, _, labels = self._export_and_import(labels)
+
+        # Numeric-looking strings are loaded as numbers
+        cat1, cat2 = labels["detections"].detections
+        for cat in (cat1, cat2):
+            self._assert_attributes(
+                cat,
+                {
+                    "count": 5.0,
+                    "offset": -1.5,
+                    "color": "black",
+                    "direction": "north",
+                    "weight": 2.5,
+                },
+            )
+            self.assertIsInstance(cat.attributes["count"], fo.NumericAttribute)
+            self.assertIsInstance(
+                cat.attributes["direction"], fo.CategoricalAttribute
+            )
+
+        # Repeated categorical values are shared
+        self.assertIs(
+            cat1.attributes["color"].value, cat2.attributes["color"].value
+        )
+
+    def test_lazy(self):
+        exporter = fouc.CVATImageDatasetExporter(self.export_dir)
+        with exporter:
+            for idx in range(3):
+                labels = fo.Detections(
+                    detections=[
+                        fo.Detection(
+                            label="cat%d" % idx,
+                            bounding_box=[0.1, 0.1, 0.2, 0.2],
+                        )
+                    ]
+                )
+                exporter.export_sample(
+                    self.image_path, labels, metadata=self.metadata
+                )
+
+        labels_path = os.path.join(self.export_dir, "labels.xml")
+
+        info1, task_labels1, images1 = fouc.load_cvat_image_annotations(
+            labels_path
+        )
+        info2, task_labels2, images2 = fouc.load_cvat_image_annotations(
+            labels_path, lazy=True
+        )
+
+        self.assertIsInstance(images1, list)
+        self.assertNotIsInstance(images2, list)
+        self.assertDictEqual(info1, info2)
+        self.assertListEqual(task_labels1.labels, task_labels2.labels)
+
+        images2 = list(images2)
+        self.assertEqual(len(images1), 3)
+        self.assertEqual(len(images2), 3)
+        for image1, image2 in zip(images1, images2):
+            self.assertEqual(image1.name, image2.name)
+            self.assertEqual(
+                image1.to_labels()["detections"].detections[0].label,
+                image2.to_labels()["detections"].detections[0].label,
+            )
+
+
+class CVATVideoTests(CVATTests):
+    def setUp(self):
+        super().setUp()
+
+        # Videos are only copied on export, so their contents don't matter
+        self.video_path = os.path.join(self.tmp_dir, "video.mp4")
+        with open(self.video_path, "wb") as f:
+            f.write(b"\x00")
+
+        self.metadata = fo.VideoMetadata(
+            frame_width=100, frame_height=50, total_frame_count=3
+        )
+
+    def _export(self, frames_list):
+        exporter = fouc.CVATVideoDatasetExporter(self.export_dir)
+        with exporter:
+            for frames in frames_list:
+                exporter.export_sample(
+                    self.video_path, None, frames, metadata=self.metadata
+                )
+
+    def _import(self, num_workers=None):
+        importer = fouc.CVATVideoDatasetImporter(
+            self.export_dir, num_workers=num_workers
+        )
+        with importer:
+            return list(importer)
+
+    def _export_and_import(self, frames):
+        self._export([frames])
+        samples = self._import()
+
+        self.assertEqual(len(samples), 1)
+        return samples[0]
+
+    def test_roundtrip(self):
+        frames = {
+            1: {
+                "detections": fo.Detections(
+                    detections=[
+                        fo.Detection(
+                            label="car",
+                            bounding_box=[0.1, 0.2, 0.3, 0.4],
+                            index=1,
+                            attributes={
+                                "occluded": fo.BooleanAttribute(value=True),
+                                "keyframe": fo.BooleanAttribute(value=True),
+                                "outside": fo.BooleanAttribute(value=False),
+                                "make": fo.CategoricalAttribute(value="vw"),
+                            },
+                        )
+                    ]
+                ),
+                "polylines": fo.Polylines(
+                    polylines=[
+                        fo.Polyline(
+                            label="road",
+                            points=[[(0.1, 0.2), (0.5, 0.2), (0.5, 0.6)]],
+                            closed=True,
+                            filled=True,
+                            index=2,
+                        )
+                    ]
+                ),
+                "keypoints": fo.Keypoints(
+                    keypoints=[
+                        fo.Keypoint(
+                            label="joints",
+                            points=[(0.2, 0.4), (0.6, 0.8)],
+                            index=3,
+                        )
+                    ]
+                ),
+            },
+            2: {
+                "detections": fo.Detections(
+                    detections=[
+                        fo.Detection(
+                            label="car",
+                            bounding_box=[0.2, 0.2, 0.3, 0.4],
+                            index=1,
+                            attributes={
+                                "occluded": fo.BooleanAttribute(value=False),
+                                "keyframe": fo.BooleanAttribute(value=False),
+                                "outside": fo.BooleanAttribute(value=True),
+                            },
+                        ),
+                        fo.Detection(
+                            label="person", bounding_box=[0.5, 0.5, 0.5, 0.5],
+                        ),
+                    ]
+                ),
+                "polylines": fo.Polylines(
+                    polylines=[
+                        fo.Polyline(
+                            label="lane",
+                            points=[[(0.0, 0.0), (1.0, 1.0)]],
+                            closed=False,
+                            filled=False,
+                        )
+                    ]
+                ),
+            },
+        }
+
+        video_path, _, _, frames = self._export_and_import(frames)
+
+        self.assertEqual(os.path.basename(video_path), "video.mp4")
+        self.assertSetEqual(set(frames.keys()), {1, 2})
+
+        # Track on frames 1 and 2
+        (car1,) = frames[1]["detections"].detections
+        car2, person = sorted(
+            frames[2]["detections"].detections, key=lambda d: d.label
+        )
+        self.assertEqual(car1.label, "car")
+        self.assertEqual(car2.label, "car")
+        self.assertEqual(car1.index, car2.index)
+        self._assert_points(car1.bounding_box, [0.1, 0.2, 0.3, 0.4])
+        self._assert_points(car2.bounding_box, [0.2, 0.2, 0.3, 0.4])
+        self._assert_attributes(
+            car1,
+            {
+                "occluded": True,
+                "keyframe": True,
+                "outside": False,
+                "make": "vw",
+            },
+        )
+        self._assert_attributes(
+            car2, {"occluded": False, "keyframe": False, "outside": True}
+        )
+
+        # Objects without an index get their own tracks
+        self.assertEqual(person.label, "person")
+        self.assertNotEqual(person.index, car2.index)
+        self._assert_points(person.bounding_box, [0.5, 0.5, 0.5, 0.5])
+
+        (road,) = frames[1]["polylines"].polylines
+        self.assertEqual(road.label, "road")
+        self.assertTrue(road.filled)
+        self._assert_points(
+            road.points, [[(0.1, 0.2), (0.5, 0.2), (0.5, 0.6)]]
+        )
+
+        (lane,) = frames[2]["polylines"].polylines
+        self.assertEqual(lane.label, "lane")
+        self.assertFalse(lane.filled)
+        self._assert_points(lane.points, [[(0.0, 0.0), (1.0, 1.0)]])
+
+        (joints,) = frames[1]["keypoints"].keypoints
+        self.assertEqual(joints.label, "joints")
+        self._assert_points(joints.points, [(0.2, 0.4), (0.6, 0.8)])
+
+        indexes = {car1.index, road.index, joints.index, lane.index}
+        self.assertEqual(len(indexes), 4)
+
+    def test_integer_boxes(self):
+        frames = {
+            1: {
+                "detections": fo.Detections(
+                    detections=[
+                        fo.Detection(
+                            label="car", bounding_box=[0, 0, 1, 1], index=1
+                        )
+                    ]
+                )
+            }
+        }
+
+        _, _, _, frames = self._export_and_import(frames)
+
+        (car,) = frames[1]["detections"].detections
+        self._assert_points(car.bounding_box, [0.0, 0.0, 1.0, 1.0])
+
+    def _make_frames(self, label):
+        return {
+            1: {
+                "detections": fo.Detections(
+                    detections=[
+                        fo.Detection(
+                            label=label,
+                            bounding_box=[0.1, 0.1, 0.2, 0.2],
+                            index=1,
+                        )
+                    ]
+                )
+            }
+        }
+
+    def _replace_labels(self, labels_path, label):
+        # Rewrites the labels file with a new label, keeping its modification
+        # time
+        tmp_export_dir = self.export_dir
+        self.export_dir = os.path.join(self.tmp_dir, "export-" + label)
+        try:
+            self._export([self._make_frames(label)])
+            new_labels_path = os.path.join(
+                self.export_dir, "labels", os.path.basename(labels_path)
+            )
+        finally:
+            self.export_dir = tmp_export_dir
+
+        st = os.stat(labels_path)
+        with open(new_labels_path, "rb") as f:
+            contents = f.read()
+
+        with open(labels_path, "wb") as f:
+            f.write(contents)
+
+        os.utime(labels_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    def _get_label(self, frames):
+        (detection,) = frames[1]["detections"].detections
+        return detection.label
+
+    def test_cache(self):
+        self._export([self._make_frames("car")])
+        video_path = os.path.join(self.export_dir, "data", "video.mp4")
+        labels_path = os.path.join(self.export_dir, "labels", "video.xml")
+
+        # Sample parser
+        parser = fouc.CVATVideoSampleParser()
+        parser.with_sample((video_path, labels_path))
+
+        self.assertEqual(self._get_label(parser.get_frame_labels()), "car")
+        self.assertEqual(len(parser._annos_cache), 1)
+
+        # Returned labels are never shared
+        frames = parser.get_frame_labels()
+        frames[1]["detections"].detections[0].label = "other"
+        self.assertEqual(self._get_label(parser.get_frame_labels()), "car")
+
+        # Modified files are parsed again
+        self._replace_labels(labels_path, "truck")
+        self.assertEqual(self._get_label(parser.get_frame_labels()), "truck")
+
+        parser.clear_cache()
+        self.assertEqual(len(parser._annos_cache), 0)
+
+        # Importer
+        importer = fouc.CVATVideoDatasetImporter(self.export_dir)
+        with importer:
+            (sample,) = list(importer)
+            self.assertEqual(self._get_label(sample[3]), "truck")
+            self.assertEqual(len(importer._annos_cache), 1)
+
+            self._replace_labels(labels_path, "bus")
+
+            (sample,) = list(importer)
+            self.assertEqual(self._get_label(sample[3]), "bus")
+
+            importer.clear_cache()
+            self.assertEqual(len(importer._annos_cache), 0)
+
+    def test_empty_labels(self):
+        frames = {
+            1: {"detections": fo.Detections()},
+            2: {"polylines": fo.Polylines()},
+        }
+
+        video_path, _, _, frames = self._export_and_import(frames)
+
+        # Annotated videos without objects are still labeled
+        self.assertEqual(os.path.basename(video_path), "video.mp4")
+        self.assertIsNotNone(frames)
+        self.assertDictEqual(dict(frames), {})
+
+    def test_multiple_shapes(self):
+        shape1 = [(0.1, 0.2), (0.5, 0.2), (0.5, 0.6)]
+        shape2 = [(0.6, 0.6), (0.8, 0.6), (0.8, 0.8)]
+
+        # A single shape is converted without warnings
+        polyline = fo.Polyline(label="road", points=[shape1], closed=True)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            fouc.CVATVideoPolygon.from_polyline(1, polyline, (100, 50))
+
+        # Only the first of multiple shapes is exported
+        frames = {
+            1: {
+                "polylines": fo.Polylines(
+                    polylines=[
+                        fo.Polyline(
+                            label="road",
+                            points=[shape1, shape2],
+                            closed=True,
+                            filled=True,
+                            index=1,
+                        )
+                    ]
+                )
+            }
+        }
+
+        with self.assertWarns(UserWarning):
+            _, _, _, frames = self._export_and_import(frames)
+
+        (road,) = frames[1]["polylines"].polylines
+        self._assert_points(road.points, [shape1])
+
+    def test_num_workers(self):
+        frames_list = [self._make_frames("car%d" % idx) for idx in range(6)]
+
+        self._export(frames_list)
+
+        for num_workers in (None, 1, 2):
+            with self.subTest(num_workers=num_workers):
+                samples = self._import(num_workers=num_workers)
+
+                self.assertEqual(len(samples), len(frames_list))
+                labels = {}
+                for video_path, _, _, frames in samples:
+                    name = os.path.basename(video_path)
+                    labels[name] = self._get_label(frames)
+
+                # Labels must stay paired with their videos
+                self.assertEqual(len(set(labels.values())), len(frames_list))
+                for name, label in labels.items():
+                    xml_path = os.path.join(
+                        self.export_dir,
+                        "labels",
+                        os.path.splitext(name)[0] + ".xml",
+                    )
+                    _, _, cvat_tracks = fouc.load_cvat_video_annotations(
+                        xml_path, num_workers=num_workers
+                    )
+                    self.assertEqual(cvat_tracks[0].label, label)
+
+
+if __name__ == "__main__":
+    fo.config.show_progress_bars = False
+    unittest.main(verbosity=2)
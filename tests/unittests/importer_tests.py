@@ -0,0 +1,72 @@
+"""
+FiftyOne dataset importer unit tests.
+
+| Copyright 2017-2021, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import os
+import tempfile
+import unittest
+
+import eta.core.utils as etau
+
+import fiftyone.utils.data.importers as foudi
+
+
+class DirectoryTreeTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp_dir.name
+        self.dataset_dir = os.path.join(self.tmp_dir, "dataset")
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _touch(self, *args):
+        path = os.path.join(self.dataset_dir, *args)
+        etau.ensure_basedir(path)
+        open(path, "w").close()
+        return path
+
+    def test_count_files_in_subdirs(self):
+        for idx in range(3):
+            self._touch("cat", "%d.jpg" % idx)
+            self._touch("dog", "%d.jpg" % idx)
+
+        # Hidden files and directories
+        self._touch("cat", ".DS_Store")
+        self._touch(".hidden", "0.jpg")
+
+        # Nested directories and top-level files
+        self._touch("cat", "nested", "0.jpg")
+        self._touch("README.txt")
+
+        # Symlinks to files, broken symlinks and symlinks to directories
+        outside_path = os.path.join(self.tmp_dir, "outside.jpg")
+        open(outside_path, "w").close()
+        os.symlink(
+            outside_path, os.path.join(self.dataset_dir, "dog", "l.jpg")
+        )
+        os.symlink(
+            os.path.join(self.tmp_dir, "missing.jpg"),
+            os.path.join(self.dataset_dir, "dog", "broken.jpg"),
+        )
+        os.symlink(
+            os.path.join(self.dataset_dir, "cat"),
+            os.path.join(self.dataset_dir, "kitten"),
+        )
+
+        # Must match counting via `etau.list_subdirs()` and `etau.list_files()`
+        expected = 0
+        for class_dir in etau.list_subdirs(self.dataset_dir, abs_paths=True):
+            expected += len(etau.list_files(class_dir))
+
+        self.assertEqual(expected, 10)
+        self.assertEqual(
+            foudi._count_files_in_subdirs(self.dataset_dir), expected
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
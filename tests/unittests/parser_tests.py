@@ -0,0 +1,350 @@
+"""
+FiftyOne sample parser unit tests.
+
+| Copyright 2017-2021, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+from PIL import Image
+
+import eta.core.image as etai
+
+import fiftyone as fo
+import fiftyone.utils.data as foud
+import fiftyone.utils.data.parsers as foudp
+import fiftyone.utils.kitti as fouk
+import fiftyone.utils.voc as fouv
+import fiftyone.utils.yolo as fouy
+
+from decorators import drop_datasets
+
+
+class DetectionSampleParserTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp_dir.name
+
+        self.img = np.zeros((50, 100, 3), dtype=np.uint8)
+        self.image_path = os.path.join(self.tmp_dir, "image.png")
+        etai.write(self.img, self.image_path)
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _write_txt(self, filename, contents):
+        txt_path = os.path.join(self.tmp_dir, filename)
+        with open(txt_path, "w") as f:
+            f.write(contents)
+
+        return txt_path
+
+    def _assert_box(self, detection, bounding_box):
+        np.testing.assert_allclose(detection.bounding_box, bounding_box)
+
+    def test_voc(self):
+        annotation = {
+            "annotation": {
+                "size": {"width": "100", "height": "50", "depth": "3"},
+                "object": [
+                    {
+                        "name": "cat",
+                        "bndbox": {
+                            "xmin": "10",
+                            "ymin": "5",
+                            "xmax": "60",
+                            "ymax": "30",
+                        },
+                    }
+                ],
+            }
+        }
+
+        parser = fouv.VOCDetectionSampleParser()
+        parser.with_sample((self.image_path, annotation))
+        label = parser.get_label()
+
+        self.assertIsInstance(label, fo.Detections)
+        self.assertEqual(len(label.detections), 1)
+        self.assertEqual(label.detections[0].label, "cat")
+        self._assert_box(label.detections[0], [0.1, 0.1, 0.5, 0.5])
+
+        parser.with_sample((self.image_path, None))
+        self.assertIsNone(parser.get_label())
+
+    def test_yolo(self):
+        txt_path = self._write_txt("labels.txt", "1 0.5 0.5 0.2 0.4\n")
+
+        parser = fouy.YOLOSampleParser(classes=["cat", "dog"])
+        parser.with_sample((self.image_path, txt_path))
+        label = parser.get_label()
+
+        self.assertIsInstance(label, fo.Detections)
+        self.assertEqual(len(label.detections), 1)
+        self.assertEqual(label.detections[0].label, "dog")
+        self._assert_box(label.detections[0], [0.4, 0.3, 0.2, 0.4])
+
+        parser.with_sample((self.image_path, None))
+        self.assertIsNone(parser.get_label())
+
+    def test_kitti(self):
+        txt_path = self._write_txt(
+            "labels.txt", "Car 0.00 0 -1.5 10.0 5.0 60.0 30.0\n"
+        )
+
+        parser = fouk.KITTIDetectionSampleParser()
+
+        # Image on disk
+        parser.with_sample((self.image_path, txt_path))
+        label = parser.get_label()
+
+        self.assertIsInstance(label, fo.Detections)
+        self.assertEqual(len(label.detections), 1)
+        self.assertEqual(label.detections[0].label, "Car")
+        self._assert_box(label.detections[0], [0.1, 0.1, 0.5, 0.5])
+
+        # In-memory image
+        parser.with_sample((self.img, txt_path))
+        label = parser.get_label()
+
+        self._assert_box(label.detections[0], [0.1, 0.1, 0.5, 0.5])
+
+        parser.with_sample((self.image_path, None))
+        self.assertIsNone(parser.get_label())
+
+
+class FrameSizeTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp_dir.name
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _write_jpg(self, orientation):
+        image_path = os.path.join(self.tmp_dir, "image%d.jpg" % orientation)
+
+        img = Image.new("RGB", (100, 50))
+        exif = img.getexif()
+        exif[0x0112] = orientation
+        img.save(image_path, exif=exif)
+
+        return image_path
+
+    def test_exif_orientation(self):
+        txt_path = os.path.join(self.tmp_dir, "labels.txt")
+        with open(txt_path, "w") as f:
+            f.write("Car 0.00 0 -1.5 10.0 5.0 40.0 30.0\n")
+
+        parser = fouk.KITTIDetectionSampleParser()
+
+        for orientation in range(1, 9):
+            with self.subTest(orientation=orientation):
+                image_path = self._write_jpg(orientation)
+                img = etai.read(image_path)
+
+                self.assertEqual(
+                    foudp._read_frame_size(image_path),
+                    etai.to_frame_size(img=img),
+                )
+
+                # Reading the header must match decoding the image
+                parser.with_sample((image_path, txt_path))
+                label1 = parser.get_label()
+
+                parser.with_sample((img, txt_path))
+                label2 = parser.get_label()
+
+                np.testing.assert_allclose(
+                    label1.detections[0].bounding_box,
+                    label2.detections[0].bounding_box,
+                )
+
+
+class VideoMetadataTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp_dir.name
+
+        self.video_path = os.path.join(self.tmp_dir, "video.mp4")
+        with open(self.video_path, "wb") as f:
+            f.write(b"\x00")
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_compute_metadata(self):
+        build_for = lambda video_path: fo.VideoMetadata(
+            size_bytes=os.path.getsize(video_path)
+        )
+
+        sample = fo.Sample(filepath=self.video_path)
+        parser = foud.FiftyOneUnlabeledVideoSampleParser(compute_metadata=True)
+        parser.with_sample(sample)
+
+        with mock.patch.object(
+            fo.VideoMetadata, "build_for", side_effect=build_for
+        ) as probe:
+            metadata1 = parser.get_video_metadata()
+            metadata2 = parser.get_video_metadata()
+
+            self.assertEqual(probe.call_count, 1)
+            self.assertEqual(metadata1.size_bytes, 1)
+            self.assertIsNot(metadata1, metadata2)
+
+            # Replace the file, but keep its modification time
+            st = os.stat(self.video_path)
+            with open(self.video_path, "wb") as f:
+                f.write(b"\x00\x00")
+
+            os.utime(self.video_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+            metadata3 = parser.get_video_metadata()
+
+            self.assertEqual(probe.call_count, 2)
+            self.assertEqual(metadata3.size_bytes, 2)
+
+            # New parsers don't share cached metadata
+            parser2 = foud.FiftyOneUnlabeledVideoSampleParser(
+                compute_metadata=True
+            )
+            parser2.with_sample(sample)
+            parser2.get_video_metadata()
+
+            self.assertEqual(probe.call_count, 3)
+
+
+class _ClassificationSampleParser(foud.ImageClassificationSampleParser):
+    # Waits before reading the current sample, so that a parser shared across
+    # threads would return labels for the wrong samples
+    def get_label(self):
+        if self.current_sample[1] == "bad":
+            raise ValueError("Failed to parse sample")
+
+        time.sleep(0.001)
+        return super().get_label()
+
+
+class _VideoSampleParser(foud.LabeledVideoSampleParser):
+    # Parses `(video_path, frames)` tuples
+    @property
+    def has_video_metadata(self):
+        return False
+
+    @property
+    def label_cls(self):
+        return None
+
+    @property
+    def frame_labels_cls(self):
+        return None
+
+    def get_video_path(self):
+        return self.current_sample[0]
+
+    def get_label(self):
+        return None
+
+    def get_frame_labels(self):
+        frames = self.current_sample[1]
+        if frames == "bad":
+            raise ValueError("Failed to parse sample")
+
+        time.sleep(0.001)
+        return self.current_sample[1]
+
+
+class AddSamplesTests(unittest.TestCase):
+    def _image_samples(self):
+        return [("image%d.png" % i, i % 3) for i in range(50)]
+
+    def _video_samples(self):
+        return [
+            (
+                "video%d.mp4" % i,
+                {1: {"label": fo.Classification(label=str(i))}},
+            )
+            for i in range(20)
+        ]
+
+    @drop_datasets
+    def test_add_labeled_images(self):
+        samples = self._image_samples()
+        for num_workers in (None, 0, 1, 4):
+            with self.subTest(num_workers=num_workers):
+                dataset = fo.Dataset()
+                sample_parser = _ClassificationSampleParser(
+                    classes=["a", "b", "c"]
+                )
+                dataset.add_labeled_images(
+                    samples,
+                    sample_parser,
+                    label_field="gt",
+                    num_workers=num_workers,
+                )
+
+                self.assertEqual(len(dataset), len(samples))
+                for sample, (image_path, target) in zip(dataset, samples):
+                    self.assertEqual(
+                        os.path.basename(sample.filepath), image_path
+                    )
+                    self.assertEqual(sample.gt.label, "abc"[target])
+
+    @drop_datasets
+    def test_add_labeled_videos(self):
+        for num_workers in (None, 0, 1, 4):
+            with self.subTest(num_workers=num_workers):
+                samples = self._video_samples()
+                dataset = fo.Dataset()
+                dataset.add_labeled_videos(
+                    samples,
+                    _VideoSampleParser(),
+                    label_field="gt",
+                    num_workers=num_workers,
+                )
+
+                self.assertEqual(len(dataset), len(samples))
+                for idx, sample in enumerate(dataset):
+                    self.assertEqual(
+                        os.path.basename(sample.filepath), "video%d.mp4" % idx
+                    )
+                    self.assertEqual(
+                        sample.frames[1]["gt_label"].label, str(idx)
+                    )
+
+    @drop_datasets
+    def test_parse_error(self):
+        for num_workers in (None, 0, 1, 4):
+            with self.subTest(num_workers=num_workers):
+                image_samples = self._image_samples()
+                image_samples.insert(25, ("bad.png", "bad"))
+
+                video_samples = self._video_samples()
+                video_samples.insert(10, ("bad.mp4", "bad"))
+
+                dataset = fo.Dataset()
+
+                with self.assertRaises(ValueError):
+                    dataset.add_labeled_images(
+                        image_samples,
+                        _ClassificationSampleParser(classes=["a", "b", "c"]),
+                        num_workers=num_workers,
+                    )
+
+                with self.assertRaises(ValueError):
+                    dataset.add_labeled_videos(
+                        video_samples,
+                        _VideoSampleParser(),
+                        num_workers=num_workers,
+                    )
+
+
+if __name__ == "__main__":
+    fo.config.show_progress_bars = False
+    unittest.main(verbosity=2)
@@ -5,11 +5,16 @@ FiftyOne utilities unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import os
+import tempfile
 import time
 import unittest
 
 from mongoengine.errors import ValidationError
 import numpy as np
+from PIL import Image
+
+import eta.core.image as etai
 
 import fiftyone as fo
 import fiftyone.constants as foc
@@ -226,6 +231,71 @@ class UIDTests(unittest.TestCase):
         self.assertTrue(fou._import_logged)
 
 
+class ImageMetadataTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp_dir.name
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _make_images(self):
+        size = (100, 50)
+        images = {
+            "L": Image.new("L", size),
+            "LA": Image.new("LA", size),
+            "RGB": Image.new("RGB", size),
+            "RGBA": Image.new("RGBA", size),
+            "CMYK": Image.new("CMYK", size),
+        }
+
+        img = Image.new("P", size)
+        img.putpalette([0, 0, 0, 255, 255, 255])
+        images["P"] = img
+
+        img = Image.new("P", size)
+        img.putpalette([0, 0, 0, 255, 255, 255])
+        img.info["transparency"] = 0
+        images["P-transparency"] = img
+
+        return images
+
+    def test_build_for_path(self):
+        for name, img in self._make_images().items():
+            ext = ".jpg" if img.mode == "CMYK" else ".png"
+            image_path = os.path.join(self.tmp_dir, name + ext)
+            img.save(image_path)
+
+            with self.subTest(mode=name):
+                metadata = fo.ImageMetadata.build_for(image_path)
+
+                # Must match the values of images decoded via OpenCV
+                expected = etai.ImageMetadata.build_for(image_path)
+
+                self.assertEqual(
+                    (metadata.width, metadata.height), expected.frame_size
+                )
+                self.assertEqual(metadata.num_channels, expected.num_channels)
+                self.assertEqual(metadata.size_bytes, expected.size_bytes)
+                self.assertEqual(metadata.mime_type, expected.mime_type)
+
+    def test_build_for_image(self):
+        for shape, num_channels in (
+            ((50, 100), 1),
+            ((50, 100, 1), 1),
+            ((50, 100, 3), 3),
+            ((50, 100, 4), 4),
+        ):
+            with self.subTest(shape=shape):
+                img = np.zeros(shape, dtype=np.uint8)
+                metadata = fo.ImageMetadata.build_for(img)
+
+                self.assertEqual(metadata.width, 100)
+                self.assertEqual(metadata.height, 50)
+                self.assertEqual(metadata.num_channels, num_channels)
+                self.assertIsNone(metadata.size_bytes)
+
+
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
     unittest.main(verbosity=2)
@@ -992,6 +992,14 @@ class ViewStageTests(unittest.TestCase):
         result = list(self.dataset.take(1))
         self.assertIs(len(result), 1)
 
+        result = list(self.dataset.take(5))
+        self.assertIs(len(result), 2)
+
+        # Seeded takes of the whole dataset are still reproducible
+        ids1 = [s.id for s in self.dataset.take(5, seed=51)]
+        ids2 = [s.id for s in self.dataset.take(5, seed=51)]
+        self.assertListEqual(ids1, ids2)
+
     def test_uuids(self):
         stage = fosg.Take(1)
         stage_dict = stage._serialize()
@@ -0,0 +1,306 @@
+"""
+FiftyOne Zoo unit tests.
+
+| Copyright 2017-2021, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+import eta.core.utils as etau
+
+import fiftyone.utils.bdd as foub
+import fiftyone.utils.cityscapes as foucs
+import fiftyone.zoo.datasets.base as fozdb
+
+
+def _list_tree(root):
+    # Returns a dict mapping relative paths of the files in `root` to their
+    # contents, and relative paths of directories to None
+    tree = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        for dirname in dirnames:
+            path = os.path.join(dirpath, dirname)
+            tree[os.path.relpath(path, root)] = None
+
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            with open(path, "rb") as f:
+                tree[os.path.relpath(path, root)] = f.read()
+
+    return tree
+
+
+class ExtractZipTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp_dir.name
+        self.zip_path = os.path.join(self.tmp_dir, "archive.zip")
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _write_zip(self, members):
+        with zipfile.ZipFile(self.zip_path, "w") as zf:
+            for name, contents in members:
+                zf.writestr(name, contents)
+
+    def _extract(self, outdir, **kwargs):
+        outdir = os.path.join(self.tmp_dir, outdir)
+        fozdb._extract_zip(self.zip_path, outdir, **kwargs)
+        return outdir
+
+    def test_extract(self):
+        # Directory entries come after the files that they contain
+        members = [("file%d.txt" % i, b"root%d" % i) for i in range(5)]
+        members += [("a/b/file%d.txt" % i, b"b%d" % i) for i in range(20)]
+        members += [("a/c/file.txt", b"c"), ("a/", b""), ("a/b/", b"")]
+        members += [("a/empty/", b"")]
+        self._write_zip(members)
+
+        expected = {
+            name.rstrip("/"): contents
+            for name, contents in members
+            if not name.endswith("/")
+        }
+        expected.update({"a": None, "a/b": None, "a/c": None})
+        expected["a/empty"] = None
+
+        for num_workers in (1, 4):
+            with self.subTest(num_workers=num_workers):
+                outdir = self._extract(
+                    "out%d" % num_workers, num_workers=num_workers
+                )
+                self.assertDictEqual(_list_tree(outdir), expected)
+
+    def test_unsafe_paths(self):
+        self._write_zip(
+            [
+                ("../evil1.txt", b"1"),
+                ("/abs/evil2.txt", b"2"),
+                ("a/../../evil3.txt", b"3"),
+                ("../evil_dir/evil4.txt", b"4"),
+                ("../evil_dir2/", b""),
+            ]
+        )
+
+        for num_workers in (1, 4):
+            with self.subTest(num_workers=num_workers):
+                root = os.path.join(self.tmp_dir, "root%d" % num_workers)
+                outdir = os.path.join(root, "out")
+                os.makedirs(outdir)
+
+                fozdb._extract_zip(
+                    self.zip_path, outdir, num_workers=num_workers
+                )
+
+                # Nothing may be written outside of `outdir`
+                self.assertListEqual(os.listdir(root), ["out"])
+
+                tree = _list_tree(outdir)
+                self.assertEqual(tree["evil1.txt"], b"1")
+                self.assertEqual(tree[os.path.join("abs", "evil2.txt")], b"2")
+                self.assertEqual(tree[os.path.join("a", "evil3.txt")], b"3")
+                self.assertEqual(
+                    tree[os.path.join("evil_dir", "evil4.txt")], b"4"
+                )
+                self.assertIsNone(tree["evil_dir2"])
+
+    def test_exclude(self):
+        self._write_zip(
+            [
+                ("a/keep.txt", b"keep"),
+                ("a/skip/", b""),
+                ("a/skip/file.txt", b"skip"),
+                ("a/skipped.txt", b"not excluded"),
+                ("a/file.txt", b"skip"),
+                ("b/file.txt", b"keep"),
+            ]
+        )
+
+        for num_workers in (1, 4):
+            with self.subTest(num_workers=num_workers):
+                outdir = self._extract(
+                    "out%d" % num_workers,
+                    exclude=("a/skip", "a/file.txt"),
+                    num_workers=num_workers,
+                )
+
+                self.assertDictEqual(
+                    _list_tree(outdir),
+                    {
+                        "a": None,
+                        "b": None,
+                        os.path.join("a", "keep.txt"): b"keep",
+                        os.path.join("a", "skipped.txt"): b"not excluded",
+                        os.path.join("b", "file.txt"): b"keep",
+                    },
+                )
+
+
+class ExtractTarTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp_dir.name
+        self.tar_path = os.path.join(self.tmp_dir, "archive.tar")
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_exclude(self):
+        root = "256_ObjectCategories"
+        with tarfile.open(self.tar_path, "w") as tf:
+            for name in (
+                "056.dog/001.jpg",
+                "056.dog/greg/001.jpg",
+                "056.dog/gregory.jpg",
+                "198.spider/001.jpg",
+                "198.spider/RENAME2",
+            ):
+                contents = name.encode()
+                info = tarfile.TarInfo(root + "/" + name)
+                info.size = len(contents)
+                tf.addfile(info, io.BytesIO(contents))
+
+        outdir = os.path.join(self.tmp_dir, "out")
+        fozdb._extract_tar(
+            self.tar_path, outdir, fozdb.Caltech256Dataset._EXCLUDED_PATHS
+        )
+
+        self.assertDictEqual(
+            _list_tree(os.path.join(outdir, root)),
+            {
+                "056.dog": None,
+                "198.spider": None,
+                os.path.join("056.dog", "001.jpg"): b"056.dog/001.jpg",
+                os.path.join("056.dog", "gregory.jpg"): b"056.dog/gregory.jpg",
+                os.path.join("198.spider", "001.jpg"): b"198.spider/001.jpg",
+            },
+        )
+
+
+class CityscapesTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp_dir.name
+        self.zip_path = os.path.join(self.tmp_dir, "leftImg8bit.zip")
+        self.scratch_dir = os.path.join(self.tmp_dir, "scratch")
+
+        with zipfile.ZipFile(self.zip_path, "w") as zf:
+            zf.writestr("README", b"readme")
+            zf.writestr("leftImg8bit/", b"")
+            for split in ("train", "train_extra", "val", "test"):
+                zf.writestr("leftImg8bit/%s/" % split, b"")
+                for city in ("aachen", "bonn"):
+                    zf.writestr(
+                        "leftImg8bit/%s/%s/image.png" % (split, city),
+                        split.encode(),
+                    )
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_extract_splits(self):
+        images_dir = foucs._extract_images(
+            self.zip_path, self.scratch_dir, ["train", "test"]
+        )
+
+        self.assertEqual(
+            images_dir, os.path.join(self.scratch_dir, "images", "leftImg8bit")
+        )
+        self.assertListEqual(sorted(os.listdir(images_dir)), ["test", "train"])
+        self.assertListEqual(
+            os.listdir(os.path.dirname(images_dir)), ["leftImg8bit"]
+        )
+
+        tree = _list_tree(os.path.join(images_dir, "train"))
+        self.assertDictEqual(
+            tree,
+            {
+                "aachen": None,
+                "bonn": None,
+                os.path.join("aachen", "image.png"): b"train",
+                os.path.join("bonn", "image.png"): b"train",
+            },
+        )
+
+        # Splits that were already extracted are left untouched
+        marker_path = os.path.join(images_dir, "train", "marker")
+        open(marker_path, "w").close()
+
+        foucs._extract_images(
+            self.zip_path, self.scratch_dir, ["train", "val"]
+        )
+
+        self.assertListEqual(
+            sorted(os.listdir(images_dir)), ["test", "train", "val"]
+        )
+        self.assertTrue(os.path.isfile(marker_path))
+
+
+class BDDTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_dir = self._tmp_dir.name
+        self.indir = os.path.join(self.tmp_dir, "in")
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _write(self, *args):
+        path = os.path.join(self.indir, *args)
+        etau.ensure_basedir(path)
+        with open(path, "w") as f:
+            f.write(os.path.join(*args))
+
+    def test_copy_dir(self):
+        for idx in range(20):
+            self._write("train", "%d.jpg" % idx)
+
+        self._write("val", "nested", "0.jpg")
+        self._write(".hidden")
+        self._write(".hidden_dir", "0.jpg")
+        etau.ensure_dir(os.path.join(self.indir, "empty"))
+
+        outside_path = os.path.join(self.tmp_dir, "outside.jpg")
+        with open(outside_path, "w") as f:
+            f.write("outside")
+
+        os.symlink(outside_path, os.path.join(self.indir, "link.jpg"))
+        os.symlink(
+            os.path.join(self.tmp_dir, "missing.jpg"),
+            os.path.join(self.indir, "broken.jpg"),
+        )
+        os.symlink(
+            os.path.join(self.indir, "val"), os.path.join(self.indir, "val2")
+        )
+
+        # Must match `etau.copy_dir()`
+        expected_dir = os.path.join(self.tmp_dir, "expected")
+        etau.copy_dir(self.indir, expected_dir)
+        expected = _list_tree(expected_dir)
+
+        self.assertIn(".hidden", expected)
+        self.assertNotIn(".hidden_dir", expected)
+        self.assertEqual(expected["link.jpg"], b"outside")
+        self.assertIn(os.path.join("val2", "nested", "0.jpg"), expected)
+
+        for num_workers in (1, 4):
+            with self.subTest(num_workers=num_workers):
+                outdir = os.path.join(self.tmp_dir, "out%d" % num_workers)
+
+                # Existing outputs are replaced
+                etau.ensure_dir(os.path.join(outdir, "stale"))
+
+                foub._copy_dir(self.indir, outdir, num_workers=num_workers)
+
+                self.assertDictEqual(_list_tree(outdir), expected)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)